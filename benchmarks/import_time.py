@@ -0,0 +1,70 @@
+"""
+Import-time benchmark and guard for the nfl_tracks package.
+
+Imports each module in a fresh interpreter, reports the best wall time of `--repeat` runs, and fails if a module
+pulls in a heavy or optional dependency it should only load on first use.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --max-seconds 1.0
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'nfl_tracks')
+
+# Module -> dependencies that importing it must not load.
+GUARDS = {
+    'nfl': ['pandas', 'matplotlib', 'seaborn', 'IPython', 'scipy'],
+    'nfl.metrics': ['matplotlib', 'seaborn', 'IPython', 'scipy'],
+    'nfl.spatial': ['matplotlib', 'seaborn', 'IPython', 'scipy'],
+    'nfl.store': ['matplotlib', 'seaborn', 'IPython', 'scipy'],
+    'nfl.track': ['matplotlib', 'seaborn', 'IPython', 'scipy'],
+    'nfl.loader': ['matplotlib', 'seaborn', 'IPython', 'scipy'],
+    'nfl.cache': ['matplotlib', 'seaborn', 'IPython', 'scipy'],
+    'nfl.pipeline': ['matplotlib', 'seaborn', 'IPython', 'scipy'],
+    'nfl.coverage': ['matplotlib', 'seaborn', 'IPython', 'scipy'],
+    'nfl.visuals': ['seaborn', 'IPython', 'scipy'],
+    'nfl.plots': ['seaborn', 'IPython', 'scipy'],
+}
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = sorted({{name.split('.')[0] for name in sys.modules}})
+print(json.dumps({{'seconds': elapsed, 'loaded': loaded}}))
+"""
+
+def probe(module):
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(filter(None, [PACKAGE_DIR, os.environ.get('PYTHONPATH')]))}
+    env.pop('DISPLAY', None)
+    output = subprocess.run([sys.executable, '-c', _PROBE.format(module=module)], env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--max-seconds', type=float, help="Also fail if importing nfl.metrics takes longer than this.")
+    args = parser.parse_args(argv)
+
+    failures = []
+    for module, forbidden in GUARDS.items():
+        runs = [probe(module) for _ in range(args.repeat)]
+        seconds = min(run['seconds'] for run in runs)
+        leaked = [dep for dep in forbidden if dep in runs[0]['loaded']]
+        print(f"{module:<14} {seconds * 1000:>8.1f} ms  {'loads ' + ', '.join(leaked) if leaked else 'ok'}")
+        if leaked:
+            failures.append(f"{module} imports {', '.join(leaked)}")
+        if module == 'nfl.metrics' and args.max_seconds is not None and seconds > args.max_seconds:
+            failures.append(f"{module} took {seconds:.3f}s to import (limit {args.max_seconds}s)")
+
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Benchmarks for the nfl_tracks metrics and rendering paths on synthetic BDB-schema data.
+
+Measures wall time (best of `--repeat` runs) and peak memory traced by tracemalloc of every benchmark at each
+requested data size. Rendering benchmarks run on a single play only, since their cost does not depend on the dataset
+size.
+
+    python benchmarks/run_benchmarks.py --sizes play game week
+    python benchmarks/run_benchmarks.py --sizes season --json season.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'nfl_tracks'))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from nfl import coverage, metrics, visuals
+from nfl.config import NFLTracksConfig
+from nfl.synthetic import generate_tracking_data, generate_context_data
+
+# (n_games, n_plays per game, n_frames per play)
+SIZES = {
+    'play': (1, 1, 50),
+    'game': (1, 40, 50),
+    'week': (16, 40, 50),
+    'season': (272, 40, 50),
+}
+
+def measure(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    # Tracing slows allocation-heavy code down, so memory is measured in a separate run.
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(timings), peak
+
+def metric_benchmarks(data, config):
+    return {
+        'calculate_separation_batch': lambda: metrics.calculate_separation_batch(data, config),
+        'get_total_distance_traveled_batch': lambda: metrics.get_total_distance_traveled_batch(data, config),
+        'get_play_speed_stats_batch': lambda: metrics.get_play_speed_stats_batch(data, config),
+        'coverage_matchups': lambda: coverage.coverage_matchups(data, config),
+    }
+
+def render_benchmarks(data, context, config, n_frames):
+    game_id, play_id = data[config.game_col].iloc[0], data[config.play_col].iloc[0]
+    play = visuals.Play(data, game_id, play_id, context, config)
+    animated = play.data[play.data[config.frame_col] <= n_frames]
+    short_play = visuals.Play(animated, game_id, play_id, context, config)
+
+    def close_after(func):
+        def run():
+            func()
+            plt.close('all')
+        return run
+
+    return {
+        'field': close_after(lambda: visuals.field()),
+        'plot_snap': close_after(lambda: play.plot_snap(1)),
+        'plot_snap_relay': close_after(lambda: play.plot_snap(1, relay=True)),
+        f'animate_{n_frames}_frames': close_after(lambda: short_play.animate(kaggle=False).save(os.devnull, writer='pillow_stream')),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', default=['play', 'game', 'week'], choices=list(SIZES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--animate-frames', type=int, default=10)
+    parser.add_argument('--no-render', action='store_true', help="Skip the rendering benchmarks.")
+    parser.add_argument('--json', help="Also write the results to this JSON file.")
+    args = parser.parse_args(argv)
+
+    config = NFLTracksConfig()
+    results = []
+    for size in args.sizes:
+        n_games, n_plays, n_frames = SIZES[size]
+        data = generate_tracking_data(n_games, n_plays, n_frames, seed=0, config=config)
+        benchmarks = metric_benchmarks(data, config)
+        if size == 'play':
+            benchmarks['calculate_separation'] = lambda: metrics.calculate_separation(data, config)
+            benchmarks['get_total_distance_traveled'] = lambda: metrics.get_total_distance_traveled(data, config)
+            benchmarks['get_play_speed_stats'] = lambda: metrics.get_play_speed_stats(data, config)
+            if not args.no_render:
+                context = generate_context_data(data, config=config)
+                benchmarks.update(render_benchmarks(data, context, config, args.animate_frames))
+
+        for name, func in benchmarks.items():
+            seconds, peak = measure(func, args.repeat)
+            results.append({'size': size, 'rows': len(data), 'benchmark': name, 'seconds': seconds, 'peak_mb': peak / 1e6})
+            print(f"{size:>7} {len(data):>10} rows  {name:<36} {seconds * 1000:>10.1f} ms  {peak / 1e6:>9.1f} MB")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,16 @@
+import importlib
+
+# Submodules are imported on first attribute access, so `import nfl` stays cheap and `nfl.metrics` never pulls in
+# matplotlib, seaborn or IPython.
+_SUBMODULES = {
+    'batch', 'cache', 'config', 'coverage', 'encoding', 'loader', 'metrics', 'pipeline', 'plots', 'profiling', 'spatial', 'store', 'streaming', 'synthetic',
+    'track', 'visuals',
+}
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)
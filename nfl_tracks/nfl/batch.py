@@ -0,0 +1,115 @@
+import inspect
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import matplotlib.pyplot as plt
+
+from . import visuals
+from .config import NFLTracksConfig
+from .store import TrackingStore
+
+# Per-process state, set once by `_init_worker` so jobs never carry the tracking data themselves.
+_worker_store = None
+_worker_options = None
+_worker_template = None
+
+_TEMPLATE_ARGS = inspect.signature(visuals.RelayTemplate).parameters
+
+def _init_worker(store, options):
+    global _worker_store, _worker_options
+    plt.switch_backend('Agg')
+    _worker_store = store
+    _worker_options = options
+
+def _job_filename(game_id, play_id, frame):
+    if frame == 'all':
+        return f"{game_id}_{play_id}.gif"
+    return f"{game_id}_{play_id}_frame_{frame}.png"
+
+def _relay_template(render_kwargs):
+    # Relay snapshots of every job in the process are drawn on one template, built on first use.
+    global _worker_template
+    if _worker_template is None:
+        template_kwargs = {k: v for k, v in render_kwargs.items() if k in _TEMPLATE_ARGS}
+        if template_kwargs.get('raster'):
+            template_kwargs.setdefault('raster_dpi', render_kwargs.get('dpi', 150))
+        _worker_template = visuals.RelayTemplate(**template_kwargs)
+    return _worker_template
+
+def _render_job(job):
+    game_id, play_id, frame = job
+    options = _worker_options
+    path = os.path.join(options['output_dir'], _job_filename(game_id, play_id, frame))
+    render_kwargs = options['render_kwargs']
+    open_figures = set(plt.get_fignums())
+    error = None
+
+    start = time.perf_counter()
+    try:
+        # Built inside the try, so a template that fails to build fails the job rather than the worker.
+        template = _relay_template(render_kwargs) if frame != 'all' and render_kwargs.get('relay') else None
+        play = visuals.Play(_worker_store, game_id, play_id, ball_image_path=options['ball_image_path'], allow_network=options['allow_network'])
+        if frame == 'all':
+            play.animate(save=True, filename=path, kaggle=False, **render_kwargs)
+        else:
+            play.plot_snap(frame, save=True, filename=path, template=template, **render_kwargs)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        path = None
+    finally:
+        for num in set(plt.get_fignums()) - open_figures:
+            plt.close(num)
+    elapsed = time.perf_counter() - start
+
+    return {'game_id': game_id, 'play_id': play_id, 'frame': frame, 'path': path, 'seconds': elapsed, 'error': error}
+
+def render_plays(data, jobs, output_dir: str, context_data: pd.DataFrame = None, config: NFLTracksConfig = NFLTracksConfig(),
+                 processes: int = None, ball_image_path: str = None, allow_network: bool = True, **kwargs):
+    """
+    Renders snapshots and animations for many plays across a pool of worker processes.
+
+    Each job is a `(game_id, play_id, frame)` tuple where `frame` is a frame id for a PNG snapshot or "all" for a GIF
+    animation. Outputs are written to `output_dir` as `{game_id}_{play_id}_frame_{frame}.png` or
+    `{game_id}_{play_id}.gif`. The tracking data is indexed once into a `TrackingStore` and handed to each worker
+    when it starts, never per job. Workers render with the headless Agg backend and close every figure they open.
+    Relay snapshots are drawn on one `visuals.RelayTemplate` per worker, so the dashboard layout is built only once.
+    With `processes=1` the jobs run in the calling process on its current backend.
+
+    Args:
+        data (pd.DataFrame | TrackingStore): The tracking data, or a store already built from it.
+        jobs (list): The `(game_id, play_id, frame)` tuples to render.
+        output_dir (str): Directory the images are written to. Created if missing.
+        processes (int): Number of worker processes. Defaults to the CPU count; 1 renders in the calling process.
+        **kwargs: Passed on to `Play.plot_snap` / `Play.animate`, e.g. `relay=True` or `club_colors`.
+
+    Returns:
+        pd.DataFrame: One row per job, in job order, with the output path, render time in seconds and the error
+        message of failed jobs.
+    """
+    store = data if isinstance(data, TrackingStore) else TrackingStore(data, context_data, config)
+    os.makedirs(output_dir, exist_ok=True)
+    options = {
+        'output_dir': output_dir,
+        'ball_image_path': ball_image_path,
+        'allow_network': allow_network,
+        'render_kwargs': kwargs,
+    }
+    jobs = [tuple(job) for job in jobs]
+
+    if processes == 1:
+        global _worker_store, _worker_options, _worker_template
+        previous = (_worker_store, _worker_options, _worker_template)
+        _worker_store, _worker_options, _worker_template = store, options, None
+        try:
+            results = [_render_job(job) for job in jobs]
+        finally:
+            if _worker_template is not None:
+                _worker_template.close()
+            _worker_store, _worker_options, _worker_template = previous
+    else:
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(store, options)) as executor:
+            results = list(executor.map(_render_job, jobs))
+
+    return pd.DataFrame(results, columns=['game_id', 'play_id', 'frame', 'path', 'seconds', 'error'])
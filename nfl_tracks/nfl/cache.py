@@ -0,0 +1,180 @@
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+
+import pandas as pd
+
+from . import profiling
+from .config import NFLTracksConfig
+from .loader import _write_atomic
+from .metrics import _as_tracking_data
+
+try:
+    import pyarrow
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+# Errors raised by reading a truncated or corrupt entry, which is then treated as a miss.
+_READ_ERRORS = (OSError, EOFError, ValueError, pickle.UnpicklingError) + ((pyarrow.ArrowException,) if feather is not None else ())
+
+# Function name -> (data columns it reads besides the config's key columns, version). Bump a version whenever a
+# change to the function alters its results, so entries written by the old code are no longer read.
+METRIC_SPECS = {
+    'calculate_separation': (['x', 'y'], 1),
+    'calculate_separation_batch': (['x', 'y'], 1),
+    'get_play_speed_stats': (['s', 'player_name'], 1),
+    'get_play_speed_stats_batch': (['s', 'player_name'], 1),
+    'get_total_distance_traveled': (['x', 'y', 'player_name'], 1),
+    'get_total_distance_traveled_batch': (['x', 'y', 'player_name'], 1),
+    'coverage_matchups': (['x', 'y', 's', 'dir'], 1),
+}
+
+_EXTENSIONS = ('.feather', '.pkl')
+
+def _dump_pickle(obj, path):
+    with open(path, 'wb') as f:
+        pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+class MetricsCache:
+    """
+    Content-addressed disk cache for the results of `metrics` functions.
+
+    Results are keyed by a hash of the tracking data columns the function reads, the config's column mapping, the
+    function's name and version, and its keyword arguments, so any change to the inputs is a miss rather than a stale
+    hit. Functions not listed in `METRIC_SPECS` are keyed on all columns. DataFrames are stored as Feather files when
+    pyarrow is installed and pickled otherwise. When the directory grows beyond `max_bytes`, the least recently used
+    entries are deleted.
+
+        cache = MetricsCache('.nfl_tracks_cache/metrics')
+        separation = cache.call(metrics.calculate_separation_batch, tracking_data, config)
+        cached_distance = cache.wrap(metrics.get_total_distance_traveled_batch)
+        print(cache.stats)
+    """
+    def __init__(self, directory: str = os.path.join('.nfl_tracks_cache', 'metrics'), max_bytes: int = 2 * 1024 ** 3):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, func, tracking_data: pd.DataFrame, config: NFLTracksConfig, version: int = None, **kwargs):
+        """Returns the hex digest identifying the result of `func(tracking_data, config, **kwargs)`."""
+        name = inspect.unwrap(func).__name__
+        value_cols, default_version = METRIC_SPECS.get(name, (None, 0))
+        key_cols = [config.game_col, config.play_col, config.frame_col, config.player_id_col, config.player_side_col]
+        if value_cols is None:
+            columns = list(tracking_data.columns)
+        else:
+            columns = [col for col in key_cols + value_cols if col in tracking_data.columns]
+
+        digest = hashlib.sha256()
+        header = (name, default_version if version is None else version, sorted(vars(config).items()), sorted(kwargs.items()),
+                  [(col, str(tracking_data[col].dtype)) for col in columns], len(tracking_data))
+        digest.update(repr(header).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(tracking_data[columns], index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def _entry_path(self, key):
+        for extension in _EXTENSIONS:
+            path = os.path.join(self.directory, key + extension)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _read(self, path):
+        if path.endswith('.feather'):
+            return feather.read_feather(path, memory_map=False)
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+    def _write(self, key, result):
+        if feather is not None and isinstance(result, pd.DataFrame):
+            path = os.path.join(self.directory, key + '.feather')
+            try:
+                _write_atomic(path, lambda tmp: feather.write_feather(result, tmp, compression='uncompressed'))
+                return
+            except (ValueError, TypeError, pyarrow.ArrowException):
+                pass
+        path = os.path.join(self.directory, key + '.pkl')
+        _write_atomic(path, lambda tmp: _dump_pickle(result, tmp))
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(_EXTENSIONS):
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, name))
+        return entries
+
+    def _evict(self):
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+            self.evictions += 1
+            profiling.count('metrics_cache.evictions')
+
+    def call(self, func, tracking_data: pd.DataFrame, config: NFLTracksConfig = NFLTracksConfig(), version: int = None, **kwargs):
+        """Returns `func(tracking_data, config, **kwargs)`, reading it from the cache when a matching entry exists."""
+        tracking_data = _as_tracking_data(tracking_data, config)
+        with profiling.phase('metrics_cache.key'):
+            key = self.key(func, tracking_data, config, version, **kwargs)
+
+        path = self._entry_path(key)
+        if path is not None:
+            try:
+                result = self._read(path)
+            except _READ_ERRORS:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            else:
+                os.utime(path)
+                self.hits += 1
+                profiling.count('metrics_cache.hits')
+                return result
+
+        self.misses += 1
+        profiling.count('metrics_cache.misses')
+        result = func(tracking_data, config, **kwargs)
+        self._write(key, result)
+        self._evict()
+        return result
+
+    def wrap(self, func, version: int = None):
+        """Returns a version of `func` whose results are served from this cache."""
+        @functools.wraps(func)
+        def cached(tracking_data, config=NFLTracksConfig(), **kwargs):
+            return self.call(func, tracking_data, config, version, **kwargs)
+        return cached
+
+    @property
+    def stats(self):
+        """Hit, miss and eviction counts of this instance, plus the current number and total size of entries."""
+        entries = self._entries()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _ in entries),
+        }
+
+    def clear(self):
+        """Deletes every entry in the cache directory."""
+        for _, _, name in self._entries():
+            os.remove(os.path.join(self.directory, name))
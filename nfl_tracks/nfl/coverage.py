@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+
+from . import profiling
+from .config import NFLTracksConfig
+from .metrics import _as_tracking_data, _frame_blocks
+
+def iter_interaction_tensors(tracking_data: pd.DataFrame, config: NFLTracksConfig, chunk_size: int = 2048):
+    """
+    Yields pairwise offense x defense interaction tensors, `chunk_size` frames at a time.
+
+    Works on tracking data for any number of plays. Velocities come from the speed `s` and direction `dir` columns
+    (degrees clockwise from the +y axis, as in the BDB data). Closing speed is the rate at which a pair's distance
+    shrinks, so it is positive while the two players converge. Memory is bounded by
+    `chunk_size x max offense x max defense`.
+
+    Yields:
+        dict: `keys` (DataFrame of the chunk's game, play and frame), `offense_ids` and `defense_ids` (frames x
+        players, padded with -1), and `distance` and `closing_speed` (frames x offense x defense, NaN where either
+        player is missing).
+    """
+    tracking_data = _as_tracking_data(tracking_data, config)
+    frame_keys = [config.game_col, config.play_col, config.frame_col]
+    player_ids = tracking_data[config.player_id_col].to_numpy()
+
+    for chunk in _frame_blocks(tracking_data, config, ['x', 'y', 's', 'dir'], chunk_size):
+        n_frames = chunk['Offense'][3].shape[0]
+        key_rows = np.full(n_frames, -1)
+        ids = {}
+        for side, (rows, codes, slots, values) in chunk.items():
+            key_rows[codes] = rows
+            side_ids = np.full(values.shape[:2], -1, dtype=np.int64)
+            side_ids[codes, slots] = player_ids[rows]
+            ids[side] = side_ids
+        present = key_rows >= 0
+
+        offense, defense = chunk['Offense'][3][present], chunk['Defense'][3][present]
+        radians = np.deg2rad(np.concatenate([offense[..., 3:4], defense[..., 3:4]], axis=1))
+        speeds = np.concatenate([offense[..., 2:3], defense[..., 2:3]], axis=1)
+        velocity = speeds * np.concatenate([np.sin(radians), np.cos(radians)], axis=-1)
+        n_offense = offense.shape[1]
+
+        rel_position = offense[:, :, None, :2] - defense[:, None, :, :2]
+        rel_velocity = velocity[:, :n_offense, None, :] - velocity[:, None, n_offense:, :]
+        distance = np.sqrt(np.sum(rel_position ** 2, axis=-1))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            closing_speed = -np.sum(rel_position * rel_velocity, axis=-1) / distance
+
+        yield {
+            'keys': tracking_data[frame_keys].iloc[key_rows[present]].reset_index(drop=True),
+            'offense_ids': ids['Offense'][present],
+            'defense_ids': ids['Defense'][present],
+            'distance': distance,
+            'closing_speed': closing_speed,
+        }
+
+def _masked_ids(ids, valid):
+    return pd.arrays.IntegerArray(ids.astype(np.int64), ~valid)
+
+@profiling.timed('metrics.coverage_matchups')
+def coverage_matchups(tracking_data: pd.DataFrame, config: NFLTracksConfig, radius: float = 3.0, chunk_size: int = 2048):
+    """
+    Assigns each offensive player a covering defender in every frame and derives pairwise coverage features.
+
+    The assignment is the one-to-one matching of offense to defense that minimizes the total distance in the frame,
+    solved with scipy's `linear_sum_assignment`. When there are more offensive players than defenders, the
+    receivers left over get no assigned defender. Players whose position is NaN in a frame are left out of that
+    frame's assignment, and their row has no defender and NaN distances.
+
+    Args:
+        radius (float): Defenders within this many yards of a receiver count towards its coverage.
+        chunk_size (int): Number of frames whose interaction tensors are held in memory at once.
+
+    Returns:
+        pd.DataFrame: One row per (game, play, frame, offensive player) with the assigned defender, its distance
+        and closing speed, the nearest defender and separation, the number of defenders within `radius`, and a
+        `double_coverage` flag when there are at least two.
+    """
+    from scipy.optimize import linear_sum_assignment
+
+    results = []
+    for chunk in iter_interaction_tensors(tracking_data, config, chunk_size):
+        distance, offense_ids, defense_ids = chunk['distance'], chunk['offense_ids'], chunk['defense_ids']
+        # Players missing from a frame or without a position are left out of that frame's assignment.
+        known = ~np.isnan(distance)
+        offense_known, defense_known = known.any(axis=2), known.any(axis=1)
+
+        assigned = np.full(offense_ids.shape, -1)
+        for i in np.flatnonzero(offense_known.any(axis=1)):
+            offense_slots, defense_slots = np.flatnonzero(offense_known[i]), np.flatnonzero(defense_known[i])
+            rows, cols = linear_sum_assignment(distance[i][np.ix_(offense_slots, defense_slots)])
+            assigned[i, offense_slots[rows]] = defense_slots[cols]
+
+        frame_idx, offense_slot = np.nonzero(offense_ids >= 0)
+        assigned_slot = assigned[frame_idx, offense_slot]
+        has_assignment = assigned_slot >= 0
+        safe_slot = np.maximum(assigned_slot, 0)
+
+        pair_distance = np.where(np.isnan(distance), np.inf, distance)
+        nearest_slot = np.argmin(pair_distance, axis=2)[frame_idx, offense_slot]
+        separation = pair_distance[frame_idx, offense_slot, nearest_slot]
+        has_defender = np.isfinite(separation)
+        defenders_nearby = (pair_distance <= radius).sum(axis=2)[frame_idx, offense_slot]
+
+        result = chunk['keys'].iloc[frame_idx].reset_index(drop=True)
+        result[config.player_id_col] = offense_ids[frame_idx, offense_slot]
+        result['assigned_defender_id'] = _masked_ids(defense_ids[frame_idx, safe_slot], has_assignment)
+        result['assigned_distance'] = np.where(has_assignment, distance[frame_idx, offense_slot, safe_slot], np.nan)
+        result['closing_speed'] = np.where(has_assignment, chunk['closing_speed'][frame_idx, offense_slot, safe_slot], np.nan)
+        result['nearest_defender_id'] = _masked_ids(defense_ids[frame_idx, nearest_slot], has_defender)
+        result['separation'] = np.where(has_defender, separation, np.nan)
+        result['defenders_within_radius'] = defenders_nearby
+        result['double_coverage'] = defenders_nearby >= 2
+        results.append(result)
+
+    if not results:
+        return pd.DataFrame(columns=[config.game_col, config.play_col, config.frame_col, config.player_id_col,
+                                     'assigned_defender_id', 'assigned_distance', 'closing_speed', 'nearest_defender_id',
+                                     'separation', 'defenders_within_radius', 'double_coverage'])
+    return pd.concat(results, ignore_index=True)
@@ -0,0 +1,157 @@
+import base64
+import json
+import uuid
+from io import BytesIO
+
+import numpy as np
+import matplotlib.animation as animation
+from PIL import Image, GifImagePlugin
+
+@animation.writers.register('pillow_stream')
+class StreamingGifWriter(animation.AbstractMovieWriter):
+    """
+    A GIF writer that encodes and writes each frame as soon as it is grabbed.
+
+    Matplotlib's PillowWriter keeps every frame in memory until the animation is finished. This writer quantizes the
+    first frame to a 256-color palette, writes the GIF header, and then maps every later frame onto that palette and
+    appends only the region that changed since the previous frame. Only the previous frame is kept, so memory stays
+    flat regardless of the number of frames.
+    """
+    @classmethod
+    def isAvailable(cls):
+        return True
+
+    def setup(self, fig, outfile, dpi=None):
+        super().setup(fig, outfile, dpi=dpi)
+        self._file = open(self.outfile, 'wb')
+        self._palette_image = None
+        self.bytes_written = 0
+
+    def _write(self, chunks):
+        for chunk in chunks:
+            self._file.write(chunk)
+            self.bytes_written += len(chunk)
+
+    def grab_frame(self, **savefig_kwargs):
+        buf = BytesIO()
+        self.fig.savefig(buf, **{**savefig_kwargs, 'format': 'rgba', 'dpi': self.dpi})
+        frame = Image.frombuffer('RGBA', self.frame_size, buf.getbuffer(), 'raw', 'RGBA', 0, 1).convert('RGB')
+
+        if self._palette_image is None:
+            self._palette_image = frame.quantize(colors=256)
+            header, _ = GifImagePlugin.getheader(self._palette_image, info={'loop': 0, 'optimize': False})
+            self._write(header)
+            indexed, offset = self._palette_image, (0, 0)
+            self._previous = np.asarray(indexed)
+        else:
+            indexed = frame.quantize(palette=self._palette_image, dither=Image.Dither.NONE)
+            current = np.asarray(indexed)
+            changed = current != self._previous
+            self._previous = current
+            if changed.any():
+                rows = np.flatnonzero(changed.any(axis=1))
+                cols = np.flatnonzero(changed.any(axis=0))
+                box = (int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1)
+            else:
+                box = (0, 0, 1, 1)
+            indexed, offset = indexed.crop(box), box[:2]
+        self._write(GifImagePlugin.getdata(indexed, offset=offset, duration=int(1000 / self.fps)))
+
+    def finish(self):
+        self._write([b';'])
+        self._file.close()
+
+_HTML_PLAYER_TEMPLATE = """
+<div id="{uid}" style="display:inline-block">
+  <canvas width="{width}" height="{height}" style="max-width:100%;background:url(data:image/png;base64,{background});background-size:100% 100%"></canvas>
+  <div>
+    <button type="button">Pause</button>
+    <input type="range" min="0" max="{last_frame}" value="0" style="width:60%;vertical-align:middle">
+  </div>
+</div>
+<script>
+(function() {{
+  var data = {data};
+  var root = document.getElementById("{uid}");
+  var canvas = root.querySelector("canvas"), ctx = canvas.getContext("2d");
+  var button = root.querySelector("button"), slider = root.querySelector("input");
+  var frame = 0, timer = null;
+  function draw(i) {{
+    ctx.clearRect(0, 0, canvas.width, canvas.height);
+    var players = data.frames[i];
+    for (var j = 0; j < players.length; j += 3) {{
+      ctx.beginPath();
+      ctx.arc(data.x0 + players[j] * data.sx, data.y0 - players[j + 1] * data.sy, data.radius, 0, 2 * Math.PI);
+      ctx.fillStyle = data.palette[players[j + 2]];
+      ctx.fill();
+    }}
+    var h = data.highlight[i];
+    if (h >= 0) {{
+      ctx.beginPath();
+      ctx.arc(data.x0 + players[3 * h] * data.sx, data.y0 - players[3 * h + 1] * data.sy, data.radius, 0, 2 * Math.PI);
+      ctx.lineWidth = 2.5; ctx.strokeStyle = "yellow"; ctx.stroke();
+    }}
+    slider.value = i;
+  }}
+  function play() {{
+    timer = setInterval(function() {{ frame = (frame + 1) % data.frames.length; draw(frame); }}, data.interval);
+    button.textContent = "Pause";
+  }}
+  button.onclick = function() {{
+    if (timer) {{ clearInterval(timer); timer = null; button.textContent = "Play"; }} else {{ play(); }}
+  }};
+  slider.oninput = function() {{ frame = parseInt(slider.value); draw(frame); }};
+  draw(0); play();
+}})();
+</script>
+"""
+
+def build_html_player(fig, ax, frames_xy, color_codes, palette, highlight_rows, interval=100, marker_size=100):
+    """
+    Builds a self-contained HTML/JS player that draws the players client-side over a static background.
+
+    The figure is rendered once as the background PNG, and each frame contributes only its player coordinates
+    (rounded to centimetre precision) and palette indices to a compact JSON payload.
+
+    Args:
+        fig, ax: The figure to use as background, and the axes whose data coordinates the players are drawn in.
+        frames_xy (list): One (n_players, 2) array of field coordinates per frame.
+        color_codes (list): One array of palette indices per frame.
+        palette (list): CSS color strings.
+        highlight_rows (list): Per frame, the index of the highlighted player within that frame, or -1.
+        interval (int): Delay between frames in milliseconds.
+        marker_size (float): Marker area in points^2, as for `ax.scatter`.
+
+    Returns:
+        str: The HTML snippet.
+    """
+    buf = BytesIO()
+    fig.savefig(buf, format='png', dpi=fig.dpi)
+    width, height = fig.canvas.get_width_height()
+
+    origin = ax.transData.transform((0, 0))
+    unit = ax.transData.transform((1, 1)) - origin
+    frames = []
+    for xy, codes in zip(frames_xy, color_codes):
+        payload = [[round(float(x), 2), round(float(y), 2), int(c)] for (x, y), c in zip(xy, codes)]
+        frames.append([value for player in payload for value in player])
+
+    data = {
+        'x0': round(float(origin[0]), 2),
+        'y0': round(float(height - origin[1]), 2),
+        'sx': round(float(unit[0]), 4),
+        'sy': round(float(unit[1]), 4),
+        'radius': round(marker_size ** 0.5 / 2 * fig.dpi / 72, 2),
+        'palette': palette,
+        'frames': frames,
+        'highlight': [int(h) for h in highlight_rows],
+        'interval': int(interval),
+    }
+    return _HTML_PLAYER_TEMPLATE.format(
+        uid=f"nfl-player-{uuid.uuid4().hex}",
+        width=width,
+        height=height,
+        background=base64.b64encode(buf.getvalue()).decode('ascii'),
+        last_frame=len(frames) - 1,
+        data=json.dumps(data, separators=(',', ':')),
+    )
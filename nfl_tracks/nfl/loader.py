@@ -0,0 +1,112 @@
+import os
+import hashlib
+
+import pandas as pd
+
+from .config import NFLTracksConfig
+
+try:
+    import pyarrow
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+# Columns read by the library besides the ones named in NFLTracksConfig.
+TRACKING_COLUMNS = [
+    'x', 'y', 's', 'a', 'dir', 'o',
+    'player_name', 'player_role', 'player_position', 'player_height', 'player_weight', 'player_birth_date',
+    'player_to_predict', 'play_direction', 'absolute_yardline_number', 'ball_land_x', 'ball_land_y',
+]
+
+_FLOAT_COLUMNS = ['x', 'y', 's', 'a', 'dir', 'o', 'ball_land_x', 'ball_land_y']
+_INTEGER_COLUMNS = ['player_weight', 'absolute_yardline_number']
+_CATEGORY_COLUMNS = ['player_name', 'player_role', 'player_position', 'player_height', 'player_birth_date', 'play_direction']
+
+def _config_columns(config: NFLTracksConfig):
+    return [config.game_col, config.play_col, config.frame_col, config.player_id_col, config.player_side_col]
+
+def _read_dtypes(columns, config: NFLTracksConfig):
+    # Parsed straight into compact dtypes, so the full-width float64 and object columns are never materialized.
+    dtypes = {col: 'float32' for col in _FLOAT_COLUMNS}
+    dtypes.update({col: 'category' for col in [config.player_side_col] + _CATEGORY_COLUMNS})
+    return {col: dtype for col, dtype in dtypes.items() if col in columns}
+
+def downcast_tracking_data(data: pd.DataFrame, config: NFLTracksConfig = NFLTracksConfig()):
+    """
+    Shrinks tracking data in memory without changing its values beyond float32 precision.
+
+    Coordinates, speeds and angles become float32, ids and other whole-number columns the smallest integer type that
+    holds them, and the repeated string columns (sides, roles, names, ...) categoricals.
+    """
+    data = data.copy()
+    for col in _FLOAT_COLUMNS:
+        if col in data.columns:
+            data[col] = data[col].astype('float32')
+    for col in [config.game_col, config.play_col, config.frame_col, config.player_id_col] + _INTEGER_COLUMNS:
+        if col in data.columns and data[col].notna().all():
+            data[col] = pd.to_numeric(data[col], downcast='integer')
+    for col in [config.player_side_col] + _CATEGORY_COLUMNS:
+        if col in data.columns:
+            data[col] = data[col].astype('category')
+    if 'player_to_predict' in data.columns and data['player_to_predict'].notna().all():
+        data['player_to_predict'] = data['player_to_predict'].astype(bool)
+    return data
+
+def _write_atomic(path, write):
+    # Writers in other processes may race for the same path; each writes its own temporary file and the last rename
+    # wins, so readers only ever see a complete file.
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_file = f"{path}.{os.getpid()}.tmp"
+    try:
+        write(tmp_file)
+        os.replace(tmp_file, path)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
+def _cache_path(path, columns, config, cache_dir):
+    stat = os.stat(path)
+    key = repr((os.path.abspath(path), stat.st_mtime_ns, stat.st_size, sorted(columns), sorted(vars(config).items())))
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(cache_dir, f"{stem}-{digest}.feather")
+
+def load_tracking(path: str, config: NFLTracksConfig = NFLTracksConfig(), columns: list = None, cache_dir: str = None, use_cache: bool = True):
+    """
+    Loads a tracking data CSV with only the columns the library uses, in compact dtypes.
+
+    On the first read the result is written to an uncompressed Feather (Arrow IPC) file in `cache_dir`, which
+    defaults to a `.nfl_tracks_cache` directory next to the CSV. Later loads memory-map that file instead of parsing
+    the CSV. The cache key covers the file's path, size and modification time, the selected columns and the config,
+    so an edited CSV is re-read. Caching requires pyarrow (`pip install nfl_tracks[fast]`) and is skipped without it.
+
+    Args:
+        path (str): The CSV file, e.g. `input_2023_w01.csv`.
+        config (NFLTracksConfig): Column mapping; its columns are always kept.
+        columns (list): Extra columns to keep. Defaults to `TRACKING_COLUMNS`.
+        cache_dir (str): Where to store the columnar cache.
+        use_cache (bool): Set to False to always parse the CSV and never write a cache.
+
+    Returns:
+        pd.DataFrame: The tracking data.
+    """
+    wanted = _config_columns(config) + [col for col in (columns or TRACKING_COLUMNS) if col not in _config_columns(config)]
+    use_cache = use_cache and feather is not None
+
+    if use_cache:
+        cache_dir = cache_dir or os.path.join(os.path.dirname(os.path.abspath(path)), '.nfl_tracks_cache')
+        cached_file = _cache_path(path, wanted, config, cache_dir)
+        if os.path.exists(cached_file):
+            try:
+                return feather.read_table(cached_file, memory_map=True).to_pandas(split_blocks=True)
+            except (OSError, pyarrow.ArrowException):
+                # A truncated or corrupt cache file is replaced by parsing the CSV again.
+                pass
+
+    data = pd.read_csv(path, usecols=lambda col: col in wanted, dtype=_read_dtypes(wanted, config))
+    data = downcast_tracking_data(data, config)
+
+    if use_cache:
+        _write_atomic(cached_file, lambda tmp: feather.write_feather(data, tmp, compression='uncompressed'))
+    return data
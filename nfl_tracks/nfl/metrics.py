@@ -1,72 +1,215 @@
+import warnings
+
 import pandas as pd
 import numpy as np
-from scipy.spatial.distance import cdist
 
+from . import profiling
 from .config import NFLTracksConfig
+from .track import PlayTrack
+
+def _as_tracking_data(data, config: NFLTracksConfig):
+    if isinstance(data, PlayTrack):
+        return data.to_frame(config)
+    return data
+
+def _track_frame(track: PlayTrack, config: NFLTracksConfig, player_idx, columns):
+    data = {config.game_col: np.full(len(player_idx), track.game_id), config.play_col: np.full(len(player_idx), track.play_id)}
+    data[config.player_id_col] = track.player_ids[player_idx]
+    data.update(columns)
+    if track.names is not None:
+        data['player_name'] = np.asarray(track.names, dtype=object)[player_idx]
+    return pd.DataFrame(data)
+
+def _track_separation(track: PlayTrack, config: NFLTracksConfig):
+    xy = track.values[:, :, :2].astype(float)
+    offense, defense = np.flatnonzero(track.side_mask('Offense')), np.flatnonzero(track.side_mask('Defense'))
+    distances = np.sqrt(np.sum((xy[:, offense, None, :] - xy[:, None, defense, :]) ** 2, axis=-1))
+    distances = np.where(np.isnan(distances), np.inf, distances)
+    if len(defense) == 0:
+        distances = np.full(distances.shape[:2] + (1,), np.inf)
+    nearest = np.argmin(distances, axis=2)
+    separation = np.take_along_axis(distances, nearest[:, :, None], axis=2)[:, :, 0]
+
+    frame_idx, offense_idx = np.nonzero(np.isfinite(separation))
+    return pd.DataFrame({
+        config.game_col: np.full(len(frame_idx), track.game_id),
+        config.play_col: np.full(len(frame_idx), track.play_id),
+        config.frame_col: track.frame_ids[frame_idx],
+        config.player_id_col: track.player_ids[offense[offense_idx]],
+        'separation': separation[frame_idx, offense_idx],
+        'nearest_defender_id': track.player_ids[defense[nearest[frame_idx, offense_idx]]],
+    })
+
+def _track_speed_stats(track: PlayTrack, config: NFLTracksConfig):
+    speed = track.channel('s').astype(float)
+    order = np.argsort(track.player_ids, kind='stable')
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        columns = {'max_speed': np.nanmax(speed, axis=0)[order], 'avg_speed': np.nanmean(speed, axis=0)[order]}
+    return _track_frame(track, config, order, columns)
+
+def _track_distance(track: PlayTrack, config: NFLTracksConfig):
+    xy = track.values[:, :, :2].astype(float)
+    # Positions of each player over the frames they appear in, player by player.
+    player_idx, frame_idx = np.nonzero(~np.isnan(xy[:, :, 0]).T)
+    steps = np.sqrt(np.sum(np.diff(xy[frame_idx, player_idx], axis=0) ** 2, axis=1))
+    same_player = player_idx[1:] == player_idx[:-1]
+    total_distance = np.bincount(player_idx[1:][same_player], weights=steps[same_player], minlength=len(track.player_ids))
+    order = np.argsort(track.player_ids, kind='stable')
+    return _track_frame(track, config, order, {'total_distance': total_distance[order]})
+
+def _frame_blocks(tracking_data: pd.DataFrame, config: NFLTracksConfig, value_cols, chunk_size: int):
+    """
+    Yields fixed-size chunks of frames with offense and defense rows packed into padded arrays.
+
+    Every (game, play, frame) becomes one slot of the chunk; players of each side are laid out along the second
+    axis in their original row order and missing slots are filled with NaN. Memory is bounded by `chunk_size`.
+    """
+    frame_keys = [config.game_col, config.play_col, config.frame_col]
+    frame_codes = tracking_data.groupby(frame_keys, sort=True).ngroup().to_numpy()
+    n_frames = int(frame_codes.max()) + 1 if len(frame_codes) else 0
+    sides = tracking_data[config.player_side_col].to_numpy()
+
+    blocks = {}
+    for side in ('Offense', 'Defense'):
+        rows = np.flatnonzero(sides == side)
+        rows = rows[np.argsort(frame_codes[rows], kind='stable')]
+        codes = frame_codes[rows]
+        slots = np.arange(len(rows)) - np.searchsorted(codes, codes, side='left')
+        blocks[side] = (rows, codes, slots, tracking_data[value_cols].to_numpy(dtype=float)[rows])
+
+    for start in range(0, n_frames, chunk_size):
+        stop = min(start + chunk_size, n_frames)
+        chunk = {}
+        for side, (rows, codes, slots, values) in blocks.items():
+            lo, hi = np.searchsorted(codes, [start, stop])
+            width = int(slots[lo:hi].max()) + 1 if hi > lo else 1
+            padded = np.full((stop - start, width, len(value_cols)), np.nan)
+            padded[codes[lo:hi] - start, slots[lo:hi]] = values[lo:hi]
+            chunk[side] = (rows[lo:hi], codes[lo:hi] - start, slots[lo:hi], padded)
+        yield chunk
+
+@profiling.timed('metrics.separation')
+def calculate_separation_batch(tracking_data: pd.DataFrame, config: NFLTracksConfig, chunk_size: int = 10000):
+    """
+    Calculates nearest-defender separation for every offensive player in every frame of every play.
+
+    Works on tracking data spanning any number of games and plays, or on a single `PlayTrack`. Frames are packed into padded
+    frames x offense x defense arrays and processed `chunk_size` frames at a time, so there is no Python loop over
+    frames or players.
+
+    Returns:
+        pd.DataFrame: One row per (game, play, frame, offensive player) with the separation and the id of the
+        nearest defender. Frames without any defender are skipped.
+    """
+    if isinstance(tracking_data, PlayTrack):
+        return _track_separation(tracking_data, config)
+    columns = [config.game_col, config.play_col, config.frame_col, config.player_id_col, 'separation', 'nearest_defender_id']
+    player_ids = tracking_data[config.player_id_col].to_numpy()
+
+    results = []
+    for chunk in _frame_blocks(tracking_data, config, ['x', 'y'], chunk_size):
+        off_rows, off_codes, off_slots, offense = chunk['Offense']
+        def_rows, def_codes, def_slots, defense = chunk['Defense']
+        if len(off_rows) == 0 or len(def_rows) == 0:
+            continue
+
+        distances = np.sqrt(np.sum((offense[:, :, None, :] - defense[:, None, :, :]) ** 2, axis=-1))
+        distances = np.where(np.isnan(distances), np.inf, distances)
+        nearest_slot = np.argmin(distances, axis=2)
+        min_distances = np.take_along_axis(distances, nearest_slot[:, :, None], axis=2)[:, :, 0]
+
+        defender_ids = np.zeros(defense.shape[:2], dtype=player_ids.dtype)
+        defender_ids[def_codes, def_slots] = player_ids[def_rows]
+
+        separation = min_distances[off_codes, off_slots]
+        valid = np.isfinite(separation)
+        rows = off_rows[valid]
+        results.append(pd.DataFrame({
+            config.game_col: tracking_data[config.game_col].to_numpy()[rows],
+            config.play_col: tracking_data[config.play_col].to_numpy()[rows],
+            config.frame_col: tracking_data[config.frame_col].to_numpy()[rows],
+            config.player_id_col: player_ids[rows],
+            'separation': separation[valid],
+            'nearest_defender_id': defender_ids[off_codes[valid], nearest_slot[off_codes[valid], off_slots[valid]]],
+        }))
+
+    if not results:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(results, ignore_index=True)
 
 def calculate_separation(play_data: pd.DataFrame, config: NFLTracksConfig):
     """
     Calculates the distance between each offensive player and their nearest defender for each frame.
 
-    This is a key metric for evaluating receiver route running and defensive coverage. It uses scipy's
-    efficient cdist function to compute the pairwise distances between all offensive and defensive players.
+    This is a key metric for evaluating receiver route running and defensive coverage. It is a thin wrapper around
+    `calculate_separation_batch`, which computes the pairwise distances for all frames at once.
 
     Returns:
         pd.DataFrame: A DataFrame containing frame-by-frame separation data for each offensive player.
     """
-    separation_data = []
-    for frame_id in sorted(play_data[config.frame_col].unique()):
-        frame_df = play_data[play_data[config.frame_col] == frame_id]
-        offense_df = frame_df[frame_df[config.player_side_col] == 'Offense']
-        defense_df = frame_df[frame_df[config.player_side_col] == 'Defense']
+    return calculate_separation_batch(play_data, config).drop(columns='nearest_defender_id')
 
-        if offense_df.empty or defense_df.empty:
-            continue
+def _attach_player_names(stats: pd.DataFrame, tracking_data: pd.DataFrame, keys):
+    if 'player_name' in tracking_data.columns:
+        names = tracking_data.groupby(keys, sort=True, observed=True)['player_name'].first()
+        stats = stats.join(names, on=keys)
+    return stats
+
+@profiling.timed('metrics.speed_stats')
+def get_play_speed_stats_batch(tracking_data: pd.DataFrame, config: NFLTracksConfig):
+    """
+    Calculates the maximum and average speed for each player in every play of the given tracking data.
 
-        distances = cdist(offense_df[['x', 'y']], defense_df[['x', 'y']])
+    Returns:
+        pd.DataFrame: One row per (game, play, player) with `max_speed`, `avg_speed` and the player's name.
+    """
+    if isinstance(tracking_data, PlayTrack):
+        return _track_speed_stats(tracking_data, config)
+    keys = [config.game_col, config.play_col, config.player_id_col]
+    speed_stats = tracking_data.groupby(keys, sort=True, observed=True)['s'].agg(['max', 'mean']).reset_index()
+    speed_stats = speed_stats.rename(columns={'max': 'max_speed', 'mean': 'avg_speed'})
+    return _attach_player_names(speed_stats, tracking_data, keys)
 
-        min_distances = np.min(distances, axis=1)
+@profiling.timed('metrics.distance')
+def get_total_distance_traveled_batch(tracking_data: pd.DataFrame, config: NFLTracksConfig):
+    """
+    Calculates the total distance covered by each player in every play of the given tracking data.
 
-        for i, player_id in enumerate(offense_df[config.player_id_col]):
-            separation_data.append({
-                config.game_col: play_data[config.game_col].iloc[0],
-                config.play_col: play_data[config.play_col].iloc[0],
-                config.frame_col: frame_id,
-                config.player_id_col: player_id,
-                'separation': min_distances[i]
-            })
+    Rows are sorted once by (game, play, player, frame) and the step lengths between consecutive frames are summed
+    per player with a single weighted bincount.
 
-    return pd.DataFrame(separation_data)
+    Returns:
+        pd.DataFrame: One row per (game, play, player) with `total_distance` and the player's name.
+    """
+    if isinstance(tracking_data, PlayTrack):
+        return _track_distance(tracking_data, config)
+    keys = [config.game_col, config.play_col, config.player_id_col]
+    tracks = tracking_data[keys + [config.frame_col, 'x', 'y']].sort_values(keys + [config.frame_col], kind='stable')
+
+    codes = tracks.groupby(keys, sort=False, observed=True).ngroup().to_numpy()
+    n_players = int(codes.max()) + 1 if len(codes) else 0
+    xy = tracks[['x', 'y']].to_numpy(dtype=float)
+
+    steps = np.sqrt(np.sum(np.diff(xy, axis=0) ** 2, axis=1))
+    same_player = codes[1:] == codes[:-1]
+    total_distance = np.bincount(codes[1:][same_player], weights=steps[same_player], minlength=n_players)
+
+    first_rows = np.flatnonzero(np.r_[True, ~same_player]) if len(codes) else np.array([], dtype=int)
+    distance_df = tracks[keys].iloc[first_rows].reset_index(drop=True)
+    distance_df['total_distance'] = total_distance
+    return _attach_player_names(distance_df, tracking_data, keys)
 
 def get_play_speed_stats(play_data: pd.DataFrame, config: NFLTracksConfig):
     """
     Calculates the maximum and average speed for each player within a single play.
     """
-    speed_stats = play_data.groupby(config.player_id_col)['s'].agg(['max', 'mean']).reset_index()
-    speed_stats = speed_stats.rename(columns={'max': 'max_speed', 'mean': 'avg_speed'})
-
-    player_info = play_data[[config.player_id_col, 'player_name']].drop_duplicates()
-    speed_stats = pd.merge(speed_stats, player_info, on=config.player_id_col)
-
-    return speed_stats
+    speed_stats = get_play_speed_stats_batch(play_data, config)
+    return speed_stats.drop(columns=[config.game_col, config.play_col])
 
 def get_total_distance_traveled(play_data: pd.DataFrame, config: NFLTracksConfig):
     """
     Calculates the total distance covered by each player during a play.
     """
-    distance_data = []
-    for player_id in play_data[config.player_id_col].unique():
-        player_df = play_data[play_data[config.player_id_col] == player_id].sort_values(by=config.frame_col)
-        diffs = np.diff(player_df[['x', 'y']].values, axis=0)
-        total_distance = np.sum(np.sqrt(np.sum(diffs**2, axis=1)))
-
-        distance_data.append({
-            config.player_id_col: player_id,
-            'total_distance': total_distance
-        })
-
-    distance_df = pd.DataFrame(distance_data)
-    player_info = play_data[[config.player_id_col, 'player_name']].drop_duplicates()
-    distance_df = pd.merge(distance_df, player_info, on=config.player_id_col)
-
-    return distance_df
+    distance_df = get_total_distance_traveled_batch(play_data, config)
+    return distance_df.drop(columns=[config.game_col, config.play_col])
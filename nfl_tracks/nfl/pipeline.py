@@ -0,0 +1,171 @@
+"""
+Season-wide metrics pipeline over weekly tracking files.
+
+    nfl-tracks-pipeline "data/input_2023_w*.csv" season_metrics --metrics separation distance --processes 4
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from . import coverage, loader, metrics
+from .config import NFLTracksConfig
+
+# Metric name -> function computing it for every play of a shard.
+METRICS = {
+    'separation': metrics.calculate_separation_batch,
+    'distance': metrics.get_total_distance_traveled_batch,
+    'speed': metrics.get_play_speed_stats_batch,
+    'coverage': coverage.coverage_matchups,
+}
+
+DEFAULT_METRICS = ('separation', 'distance', 'speed')
+
+_DONE_DIR = '_done'
+
+def _output_path(output_dir, metric, stem):
+    extension = '.feather' if loader.feather is not None else '.csv'
+    return os.path.join(output_dir, metric, stem + extension)
+
+def _marker_path(output_dir, stem):
+    return os.path.join(output_dir, _DONE_DIR, stem + '.json')
+
+def _source_stat(path):
+    stat = os.stat(path)
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+def _read_marker(output_dir, stem, path):
+    """Returns the shard's marker, or None if there is none or the source file changed since it was written."""
+    try:
+        with open(_marker_path(output_dir, stem)) as f:
+            marker = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    if marker.get('source_stat') != _source_stat(path):
+        return None
+    return marker
+
+def _write_result(result: pd.DataFrame, path):
+    result = result.reset_index(drop=True)
+    if path.endswith('.feather'):
+        loader._write_atomic(path, lambda tmp: loader.feather.write_feather(result, tmp))
+    else:
+        loader._write_atomic(path, lambda tmp: result.to_csv(tmp, index=False))
+
+def _dump_json(obj, path):
+    with open(path, 'w') as f:
+        json.dump(obj, f, indent=2)
+
+def _process_shard(path, output_dir, metric_names, config, cache_dir, use_cache):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    marker = _read_marker(output_dir, stem, path) or {'source': os.path.abspath(path), 'source_stat': _source_stat(path), 'outputs': {}}
+    pending = [name for name in metric_names if name not in marker['outputs']]
+    error = None
+
+    start = time.perf_counter()
+    try:
+        data = loader.load_tracking(path, config, cache_dir=cache_dir, use_cache=use_cache)
+        marker['rows'] = len(data)
+        for name in pending:
+            result = METRICS[name](data, config)
+            output = _output_path(output_dir, name, stem)
+            _write_result(result, output)
+            marker['outputs'][name] = {'path': os.path.relpath(output, output_dir), 'rows': len(result)}
+            del result
+        loader._write_atomic(_marker_path(output_dir, stem), lambda tmp: _dump_json(marker, tmp))
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    elapsed = time.perf_counter() - start
+
+    return {'shard': stem, 'path': path, 'status': 'failed' if error else 'done', 'rows': marker.get('rows'),
+            'seconds': elapsed, 'error': error}
+
+def run_pipeline(pattern, output_dir: str, metrics=DEFAULT_METRICS, processes: int = None, config: NFLTracksConfig = NFLTracksConfig(),
+                 cache_dir: str = None, use_cache: bool = True, resume: bool = True, verbose: bool = False):
+    """
+    Computes metrics for every play of a season, one weekly tracking file per worker process.
+
+    Each file matched by `pattern` is a shard. A worker loads the shard with `loader.load_tracking`, runs the batch
+    version of each metric over all of its plays, and writes one file per metric to
+    `output_dir/<metric>/<shard>.feather` (CSV without pyarrow). Only one shard per worker is in memory at a time.
+    When all of a shard's metrics are written, a marker is saved to `output_dir/_done/<shard>.json` along with the
+    source file's modification time and size. With `resume=True`, shards whose marker already lists every requested
+    metric are skipped, so an interrupted run picks up where it stopped and only the missing metrics of a shard are
+    computed. A shard whose file changed since its marker was written is recomputed in full.
+
+    Args:
+        pattern (str | list): Glob pattern(s) of the weekly CSVs, e.g. `"data/input_2023_w*.csv"`.
+        output_dir (str): Directory the partitioned results are written to. Created if missing.
+        metrics (list): Names from `METRICS` to compute.
+        processes (int): Number of worker processes. Defaults to the CPU count; 1 runs in the calling process.
+        cache_dir (str), use_cache (bool): Passed on to `loader.load_tracking`.
+        resume (bool): Skip shards that are already complete.
+        verbose (bool): Print a line as each shard finishes.
+
+    Returns:
+        pd.DataFrame: One row per shard with its status ("done", "skipped" or "failed"), row count, seconds and the
+        error message of failed shards.
+    """
+    patterns = [pattern] if isinstance(pattern, str) else list(pattern)
+    paths = sorted({path for p in patterns for path in glob.glob(p)})
+    stems = [os.path.splitext(os.path.basename(path))[0] for path in paths]
+    if len(set(stems)) != len(stems):
+        raise ValueError("Shard file names must be unique, as they name the output files.")
+    unknown = [name for name in metrics if name not in METRICS]
+    if unknown:
+        raise ValueError(f"Unknown metrics {unknown}. Available: {sorted(METRICS)}.")
+
+    os.makedirs(output_dir, exist_ok=True)
+    results = {}
+    todo = []
+    for path, stem in zip(paths, stems):
+        marker = _read_marker(output_dir, stem, path) if resume else None
+        if marker is not None and all(name in marker['outputs'] for name in metrics):
+            results[path] = {'shard': stem, 'path': path, 'status': 'skipped', 'rows': marker.get('rows'), 'seconds': 0.0, 'error': None}
+        else:
+            if not resume and os.path.exists(_marker_path(output_dir, stem)):
+                os.remove(_marker_path(output_dir, stem))
+            todo.append(path)
+
+    def report(result):
+        results[result['path']] = result
+        if verbose:
+            status = result['error'] or f"{result['rows']} rows in {result['seconds']:.1f}s"
+            print(f"{result['shard']}: {result['status']} ({status})")
+
+    args = (output_dir, list(metrics), config, cache_dir, use_cache)
+    if processes == 1:
+        for path in todo:
+            report(_process_shard(path, *args))
+    elif todo:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [executor.submit(_process_shard, path, *args) for path in todo]
+            for future in futures:
+                report(future.result())
+
+    return pd.DataFrame([results[path] for path in paths], columns=['shard', 'path', 'status', 'rows', 'seconds', 'error'])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('pattern', nargs='+', help="Glob pattern(s) of the weekly tracking CSVs.")
+    parser.add_argument('output_dir', help="Directory for the partitioned metric files.")
+    parser.add_argument('--metrics', nargs='+', default=list(DEFAULT_METRICS), choices=list(METRICS))
+    parser.add_argument('--processes', type=int, help="Number of worker processes (default: CPU count).")
+    parser.add_argument('--cache-dir', help="Where load_tracking keeps its columnar cache.")
+    parser.add_argument('--no-cache', action='store_true', help="Always parse the CSVs.")
+    parser.add_argument('--no-resume', action='store_true', help="Recompute shards that are already complete.")
+    args = parser.parse_args(argv)
+
+    report = run_pipeline(args.pattern, args.output_dir, args.metrics, args.processes, cache_dir=args.cache_dir,
+                          use_cache=not args.no_cache, resume=not args.no_resume, verbose=True)
+    counts = report['status'].value_counts()
+    print(f"{len(report)} shards: {counts.get('done', 0)} done, {counts.get('skipped', 0)} skipped, {counts.get('failed', 0)} failed")
+    return 1 if counts.get('failed', 0) else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
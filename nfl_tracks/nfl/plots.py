@@ -1,5 +1,5 @@
 import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
 import pandas as pd
 from . import visuals
 from .config import NFLTracksConfig
@@ -33,6 +33,8 @@ def plot_play_max_speeds(speed_stats_df: pd.DataFrame):
         print("Speed stats DataFrame is empty.")
         return
 
+    import seaborn as sns
+
     plt.style.use('seaborn-v0_8-whitegrid')
     fig, ax = plt.subplots(figsize=(12, 8))
 
@@ -46,21 +48,87 @@ def plot_play_max_speeds(speed_stats_df: pd.DataFrame):
     plt.tight_layout()
     plt.show()
 
-def plot_all_routes(play_data: pd.DataFrame, config: NFLTracksConfig):
+# In normalized coordinates every play runs left to right with the line of scrimmage at this x.
+NORMALIZED_LOS_X = 30
+
+def _route_coordinates(tracking_data: pd.DataFrame, config: NFLTracksConfig, player_id: int = None, normalize: bool = False):
+    """Returns the offensive rows of `tracking_data`, optionally for one player, and their (x, y) coordinates."""
+    offense = tracking_data[config.player_side_col].to_numpy() == 'Offense'
+    if player_id is not None:
+        offense &= tracking_data[config.player_id_col].to_numpy() == player_id
+    routes = tracking_data[offense]
+    x = routes['x'].to_numpy(dtype=float)
+    y = routes['y'].to_numpy(dtype=float)
+
+    if normalize:
+        missing = {'play_direction', 'absolute_yardline_number'} - set(routes.columns)
+        if missing:
+            raise ValueError(f"Normalizing routes requires the columns {sorted(missing)}.")
+        left = routes['play_direction'].to_numpy() == 'left'
+        los = routes['absolute_yardline_number'].to_numpy(dtype=float)
+        x = np.where(left, 120 - x, x) - np.where(left, 120 - los, los) + NORMALIZED_LOS_X
+        y = np.where(left, 53.3 - y, y)
+    return routes, x, y
+
+def route_density(tracking_data: pd.DataFrame, config: NFLTracksConfig, player_id: int = None, normalize: bool = False, bins=(120, 53)):
+    """
+    Bins the positions of offensive players over any number of plays into a 2D grid covering the field.
+
+    Args:
+        player_id (int): Only count this player's positions.
+        normalize (bool): Flip plays moving left so every play runs left to right, and shift each play so its line
+            of scrimmage sits at `NORMALIZED_LOS_X`.
+        bins (tuple): Number of bins along the length and width of the field.
+
+    Returns:
+        tuple: The (x bins, y bins) array of frame counts, and the x and y bin edges.
+    """
+    _, x, y = _route_coordinates(tracking_data, config, player_id, normalize)
+    return np.histogram2d(x, y, bins=bins, range=[[0, 120], [0, 53.3]])
+
+def plot_all_routes(play_data: pd.DataFrame, config: NFLTracksConfig, aggregate: bool = False, player_id: int = None, normalize: bool = False, bins=(120, 53)):
     """
     Overlays the routes of all offensive players on a single football field diagram.
+
+    With `aggregate=True` the routes of any number of plays are binned into a density grid (see `route_density`) and
+    drawn as a single image, so the figure stays light however many routes it covers.
     """
     fig, ax = visuals.field()
 
-    offense_df = play_data[play_data[config.player_side_col] == 'Offense']
+    if aggregate:
+        counts, xedges, yedges = route_density(play_data, config, player_id, normalize, bins)
+        image = ax.imshow(np.ma.masked_equal(counts.T, 0), origin='lower', extent=(xedges[0], xedges[-1], yedges[0], yedges[-1]),
+                          aspect='auto', cmap='inferno', alpha=0.8, interpolation='nearest', zorder=2)
+        fig.colorbar(image, ax=ax, label='Frames')
+        ax.set_title('Offensive Route Density')
+    else:
+        import seaborn as sns
+
+        routes, x, y = _route_coordinates(play_data, config, player_id, normalize)
+        route_keys = [config.game_col, config.play_col, config.player_id_col]
+        route_ids = routes.groupby(route_keys, sort=False).ngroup().to_numpy()
+        order = np.lexsort([routes[config.frame_col].to_numpy(), route_ids])
+        route_ids = route_ids[order]
+        starts = np.flatnonzero(np.r_[True, route_ids[1:] != route_ids[:-1]])
+        bounds = np.r_[starts, len(order)]
+
+        player_ids = routes[config.player_id_col].to_numpy()[order]
+        names = routes['player_name'].to_numpy()[order]
+        unique_players = list(routes[config.player_id_col].unique())
+        palette = sns.color_palette('bright', n_colors=len(unique_players))
 
-    palette = sns.color_palette('bright', n_colors=offense_df[config.player_id_col].nunique())
+        labelled = set()
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            rows = order[start:stop]
+            player = player_ids[start]
+            label = names[start] if player not in labelled else '_nolegend_'
+            labelled.add(player)
+            ax.plot(x[rows], y[rows], color=palette[unique_players.index(player)], linestyle='-', label=label)
 
-    for i, player_id in enumerate(offense_df[config.player_id_col].unique()):
-        player_route = offense_df[offense_df[config.player_id_col] == player_id].sort_values(by=config.frame_col)
-        ax.plot(player_route['x'], player_route['y'], color=palette[i], linestyle='-', label=player_route['player_name'].iloc[0])
+        ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
+        ax.set_title('Offensive Player Routes')
 
-    ax.set_title('Offensive Player Routes')
-    ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
+    if normalize:
+        ax.axvline(NORMALIZED_LOS_X, color='royalblue', lw=1.5, zorder=3)
     plt.tight_layout()
     plt.show()
@@ -0,0 +1,88 @@
+import functools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import pandas as pd
+
+_active_stats = ContextVar('nfl_tracks_profile_stats', default=None)
+
+class ProfileStats:
+    """
+    Per-phase wall times and call counts, plus named counters, recorded while profiling is active.
+
+    Phase times are inclusive: a phase running inside another phase (e.g. per-frame updates during encoding) is
+    counted in both.
+    """
+    def __init__(self):
+        self.phases = {}
+        self.counters = {}
+
+    def add_time(self, phase: str, seconds: float):
+        entry = self.phases.setdefault(phase, {'seconds': 0.0, 'calls': 0})
+        entry['seconds'] += seconds
+        entry['calls'] += 1
+
+    def increment(self, counter: str, amount: int = 1):
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def as_dict(self):
+        """Returns the stats as plain, JSON-serializable dictionaries for logging."""
+        return {'phases': {name: dict(entry) for name, entry in self.phases.items()}, 'counters': dict(self.counters)}
+
+    def to_frame(self):
+        """Returns one row per phase with its total seconds and call count, slowest first."""
+        rows = [{'phase': name, **entry} for name, entry in self.phases.items()]
+        return pd.DataFrame(rows, columns=['phase', 'seconds', 'calls']).sort_values('seconds', ascending=False, ignore_index=True)
+
+    def __repr__(self):
+        phases = ', '.join(f"{name}={entry['seconds']:.3f}s/{entry['calls']}" for name, entry in self.phases.items())
+        counters = ', '.join(f"{name}={value}" for name, value in self.counters.items())
+        return f"ProfileStats(phases: {phases or '-'}; counters: {counters or '-'})"
+
+@contextmanager
+def profile(stats: ProfileStats = None):
+    """
+    Records per-phase timings and counters of nfl_tracks calls made inside the block.
+
+    Instrumentation is a no-op outside this context manager. Passing an existing `stats` object accumulates into it.
+
+        with profiling.profile() as stats:
+            play.animate(relay=True, save=True)
+        print(stats.to_frame())
+    """
+    stats = stats if stats is not None else ProfileStats()
+    token = _active_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _active_stats.reset(token)
+
+@contextmanager
+def phase(name: str):
+    """Times the enclosed block as `name` when profiling is active."""
+    stats = _active_stats.get()
+    if stats is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.add_time(name, time.perf_counter() - start)
+
+def timed(name: str):
+    """Decorator form of `phase`."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def count(name: str, amount: int = 1):
+    """Adds `amount` to the counter `name` when profiling is active."""
+    stats = _active_stats.get()
+    if stats is not None:
+        stats.increment(name, amount)
@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+
+from .config import NFLTracksConfig
+
+# Frames are stacked along a third axis this many yards apart, far beyond any on-field distance.
+_FRAME_SPACING = 1000.0
+
+class SpatialIndex:
+    """
+    A KD-tree index over player positions for every frame of one or more plays.
+
+    Each (game, play, frame) is placed on its own layer of a third coordinate axis, spaced far enough apart that
+    no query can reach into another frame. One tree per side therefore answers nearest-neighbor and radius queries
+    for the whole dataset in a single batched call.
+    """
+    def __init__(self, tracking_data: pd.DataFrame, config: NFLTracksConfig = NFLTracksConfig()):
+        from scipy.spatial import cKDTree
+
+        self.config = config
+        tracking_data = tracking_data[tracking_data[['x', 'y']].notna().all(axis=1)]
+
+        frame_keys = [config.game_col, config.play_col, config.frame_col]
+        frame_codes = tracking_data.groupby(frame_keys, sort=True).ngroup().to_numpy()
+
+        self._keys = tracking_data[frame_keys].reset_index(drop=True)
+        self._sort_cols = frame_keys + [config.player_id_col]
+        self._player_ids = tracking_data[config.player_id_col].to_numpy()
+        self._sides = tracking_data[config.player_side_col].to_numpy()
+        self._points = np.column_stack([tracking_data[['x', 'y']].to_numpy(dtype=float), frame_codes * _FRAME_SPACING])
+
+        self._side_trees = {}
+        for side in ('Offense', 'Defense'):
+            rows = np.flatnonzero(self._sides == side)
+            self._side_trees[side] = (rows, cKDTree(self._points[rows]))
+
+    def _tidy(self, query_rows, neighbor_rows, distances, extra=None):
+        result = self._keys.iloc[query_rows].reset_index(drop=True)
+        result[self.config.player_id_col] = self._player_ids[query_rows]
+        result[self.config.player_side_col] = self._sides[query_rows]
+        if extra:
+            for name, values in extra.items():
+                result[name] = values
+        result['neighbor_id'] = self._player_ids[neighbor_rows]
+        result['distance'] = distances
+        return result
+
+    def _query_side(self, query_side, tree_side, k, exclude_self):
+        query_rows = np.flatnonzero(self._sides == query_side)
+        tree_rows, tree = self._side_trees[tree_side]
+        n_neighbors = k + 1 if exclude_self else k
+        if k <= 0 or len(query_rows) == 0 or len(tree_rows) == 0:
+            none = np.array([], dtype=int)
+            return self._tidy(none, none, np.array([], dtype=float), extra={'rank': none})
+
+        distances, idx = tree.query(self._points[query_rows], k=list(range(1, n_neighbors + 1)),
+                                    distance_upper_bound=_FRAME_SPACING / 2)
+        found = idx < len(tree_rows)
+        neighbor_rows = np.where(found, tree_rows[np.minimum(idx, len(tree_rows) - 1)], -1)
+        if exclude_self:
+            found &= neighbor_rows != query_rows[:, None]
+        rank = np.cumsum(found, axis=1)
+        keep = found & (rank <= k)
+
+        query_rows = np.broadcast_to(query_rows[:, None], keep.shape)[keep]
+        return self._tidy(query_rows, neighbor_rows[keep], distances[keep], extra={'rank': rank[keep]})
+
+    def _query(self, k, side, teammates):
+        sides = [side] if side is not None else ['Offense', 'Defense']
+        results = []
+        for query_side in sides:
+            tree_side = query_side if teammates else ('Defense' if query_side == 'Offense' else 'Offense')
+            results.append(self._query_side(query_side, tree_side, k, exclude_self=teammates))
+        return pd.concat(results, ignore_index=True).sort_values(self._sort_cols + ['rank'], ignore_index=True)
+
+    def nearest_opponents(self, k: int = 1, side: str = None):
+        """
+        Finds the `k` nearest opponents of every player in every frame.
+
+        Args:
+            k (int): Number of opponents to return per player.
+            side (str): Restrict the query players to 'Offense' or 'Defense'. Both sides by default.
+
+        Returns:
+            pd.DataFrame: One row per (game, play, frame, player, rank) with the neighbor id and distance in yards.
+        """
+        return self._query(k, side, teammates=False)
+
+    def nearest_teammates(self, k: int = 1, side: str = None):
+        """
+        Finds the `k` nearest teammates of every player in every frame, excluding the player itself.
+
+        Returns:
+            pd.DataFrame: One row per (game, play, frame, player, rank) with the neighbor id and distance in yards.
+        """
+        return self._query(k, side, teammates=True)
+
+    def within_radius(self, r: float):
+        """
+        Finds every pair of players within `r` yards of each other in the same frame.
+
+        Each pair is reported in both directions, so filtering on the player column yields all of that player's
+        neighbors. The neighbor's side is included to separate teammates from opponents.
+
+        Returns:
+            pd.DataFrame: One row per (game, play, frame, player, neighbor) with the distance in yards.
+        """
+        if r >= _FRAME_SPACING / 2:
+            raise ValueError(f"Radius must be smaller than {_FRAME_SPACING / 2} yards.")
+
+        from scipy.spatial import cKDTree
+
+        pairs = cKDTree(self._points).query_pairs(r, output_type='ndarray')
+        query_rows = np.concatenate([pairs[:, 0], pairs[:, 1]])
+        neighbor_rows = np.concatenate([pairs[:, 1], pairs[:, 0]])
+        distances = np.linalg.norm(self._points[query_rows, :2] - self._points[neighbor_rows, :2], axis=1)
+
+        result = self._tidy(query_rows, neighbor_rows, distances, extra=None)
+        result.insert(len(result.columns) - 1, 'neighbor_side', self._sides[neighbor_rows])
+        return result.sort_values(self._sort_cols + ['distance'], ignore_index=True)
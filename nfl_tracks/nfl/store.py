@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+
+from .config import NFLTracksConfig
+
+class TrackingStore:
+    """
+    Tracking and context data sorted and indexed by (game, play) once, for fast repeated play lookups.
+
+    The tracking rows are sorted by game, play and frame so that every play and every game occupies a contiguous
+    row range. Looking up a play is then a dictionary lookup followed by a positional slice, instead of a boolean
+    mask over the whole table.
+    """
+    def __init__(self, data: pd.DataFrame, context_data: pd.DataFrame = None, config: NFLTracksConfig = NFLTracksConfig()):
+        self.config = config
+        play_keys = [config.game_col, config.play_col]
+        self.data = data.sort_values(play_keys + [config.frame_col], kind='stable', ignore_index=True)
+
+        games = self.data[config.game_col].to_numpy()
+        plays = self.data[config.play_col].to_numpy()
+        play_starts = np.flatnonzero(np.r_[True, (games[1:] != games[:-1]) | (plays[1:] != plays[:-1])]) if len(games) else np.array([], dtype=int)
+        play_stops = np.r_[play_starts[1:], len(games)]
+        self._play_ranges = {
+            (game_id, play_id): (start, stop)
+            for game_id, play_id, start, stop in zip(games[play_starts].tolist(), plays[play_starts].tolist(), play_starts.tolist(), play_stops.tolist())
+        }
+
+        self._game_ranges = {}
+        self._game_plays = {}
+        for (game_id, play_id), (start, stop) in self._play_ranges.items():
+            game_start, _ = self._game_ranges.get(game_id, (start, stop))
+            self._game_ranges[game_id] = (game_start, stop)
+            self._game_plays.setdefault(game_id, []).append(play_id)
+
+        self.context_data = None
+        self._context_rows = {}
+        if context_data is not None:
+            self.context_data = context_data.drop_duplicates(subset=play_keys).reset_index(drop=True)
+            context_keys = zip(self.context_data[config.game_col].tolist(), self.context_data[config.play_col].tolist())
+            self._context_rows = {key: row for row, key in enumerate(context_keys)}
+
+        self._player_order = None
+        self._player_ranges = None
+
+    def __len__(self):
+        return len(self._play_ranges)
+
+    def __contains__(self, key):
+        return tuple(key) in self._play_ranges
+
+    @property
+    def plays(self):
+        """All (game_id, play_id) pairs in the store, in sorted order."""
+        return list(self._play_ranges)
+
+    def game_plays(self, game_id: int):
+        """Returns the play ids of a single game, in sorted order."""
+        return list(self._game_plays.get(game_id, []))
+
+    def play_data(self, game_id: int, play_id: int):
+        """Returns the tracking rows of a single play as a positional slice of the store, without copying."""
+        try:
+            start, stop = self._play_ranges[(game_id, play_id)]
+        except KeyError:
+            raise ValueError(f"No data found for gameId={game_id} and playId={play_id}.") from None
+        return self.data.iloc[start:stop]
+
+    def game_data(self, game_id: int):
+        """Returns the tracking rows of a single game as a positional slice of the store, without copying."""
+        try:
+            start, stop = self._game_ranges[game_id]
+        except KeyError:
+            raise ValueError(f"No data found for gameId={game_id}.") from None
+        return self.data.iloc[start:stop]
+
+    def player_data(self, player_id: int):
+        """
+        Returns every tracking row of a single player across all games and plays.
+
+        The player index is built on first use with one stable argsort over the player id column.
+        """
+        if self._player_ranges is None:
+            player_ids = self.data[self.config.player_id_col].to_numpy()
+            self._player_order = np.argsort(player_ids, kind='stable')
+            sorted_ids = player_ids[self._player_order]
+            starts = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]]) if len(sorted_ids) else np.array([], dtype=int)
+            stops = np.r_[starts[1:], len(sorted_ids)]
+            self._player_ranges = dict(zip(sorted_ids[starts].tolist(), zip(starts.tolist(), stops.tolist())))
+
+        try:
+            start, stop = self._player_ranges[player_id]
+        except KeyError:
+            raise ValueError(f"No data found for playerId={player_id}.") from None
+        return self.data.take(self._player_order[start:stop])
+
+    def context(self, game_id: int, play_id: int):
+        """Returns the context row of a single play, or None when no context data is available for it."""
+        row = self._context_rows.get((game_id, play_id))
+        if row is None:
+            return None
+        return self.context_data.iloc[row]
@@ -0,0 +1,199 @@
+import numpy as np
+import pandas as pd
+
+from .config import NFLTracksConfig
+
+class MetricsAccumulator:
+    """
+    Incremental separation, distance and speed metrics for tracking frames that arrive one at a time.
+
+    Each call to `push` takes the rows of a single frame, returns that frame's separation immediately and updates
+    a fixed amount of state per player: last position, cumulative distance, max speed, and speed sum and count.
+    Work per frame depends only on the number of players in it, never on how many frames came before. State arrays
+    grow geometrically, and `end_play` releases a finished play's players so their slots are reused, keeping
+    memory proportional to the players of the plays still in progress.
+
+    Frames of several plays may be interleaved; state is kept per (game, play, player). Frames of a play must arrive
+    in frame order. Once all frames have been pushed, `distance()` and `speed_stats()` equal
+    `metrics.get_total_distance_traveled_batch` and `metrics.get_play_speed_stats_batch` on the complete data, and
+    `separation()` (with `keep_separation=True`) equals `metrics.calculate_separation`.
+    """
+    def __init__(self, config: NFLTracksConfig = NFLTracksConfig(), keep_separation: bool = False):
+        self.config = config
+        self.keep_separation = keep_separation
+        self._slots = {}
+        self._play_slots = {}
+        self._keys = []
+        self._names = []
+        self._free = []
+        self._last_xy = np.full((0, 2), np.nan)
+        self._seen = np.zeros(0, dtype=bool)
+        self._distance = np.zeros(0)
+        self._max_speed = np.full(0, np.nan)
+        self._speed_sum = np.zeros(0)
+        self._speed_count = np.zeros(0, dtype=int)
+        self._separation_frames = []
+
+    def _grow(self, capacity):
+        n_new = capacity - len(self._seen)
+        self._last_xy = np.vstack([self._last_xy, np.full((n_new, 2), np.nan)])
+        self._seen = np.r_[self._seen, np.zeros(n_new, dtype=bool)]
+        self._distance = np.r_[self._distance, np.zeros(n_new)]
+        self._max_speed = np.r_[self._max_speed, np.full(n_new, np.nan)]
+        self._speed_sum = np.r_[self._speed_sum, np.zeros(n_new)]
+        self._speed_count = np.r_[self._speed_count, np.zeros(n_new, dtype=int)]
+
+    def _reset(self, slots):
+        self._last_xy[slots] = np.nan
+        self._seen[slots] = False
+        self._distance[slots] = 0.0
+        self._max_speed[slots] = np.nan
+        self._speed_sum[slots] = 0.0
+        self._speed_count[slots] = 0
+
+    def _player_slots(self, game_id, play_id, player_ids, names):
+        slots = np.empty(len(player_ids), dtype=int)
+        new_slots = []
+        for i, player_id in enumerate(player_ids):
+            key = (game_id, play_id, player_id)
+            slot = self._slots.get(key)
+            if slot is None:
+                if self._free:
+                    slot = self._free.pop()
+                    self._keys[slot] = key
+                    self._names[slot] = names[i] if names is not None else None
+                else:
+                    slot = len(self._keys)
+                    self._keys.append(key)
+                    self._names.append(names[i] if names is not None else None)
+                self._slots[key] = slot
+                self._play_slots.setdefault((game_id, play_id), []).append(slot)
+                new_slots.append(slot)
+            slots[i] = slot
+        if new_slots:
+            if len(self._keys) > len(self._seen):
+                self._grow(max(2 * len(self._seen), len(self._keys), 16))
+            self._reset(new_slots)
+        return slots
+
+    def push(self, frame: pd.DataFrame):
+        """
+        Consumes the rows of one frame of one play.
+
+        Returns:
+            pd.DataFrame: The frame's nearest-defender separation per offensive player, with the same columns as
+            `metrics.calculate_separation`.
+        """
+        config = self.config
+        columns = [config.game_col, config.play_col, config.frame_col, config.player_id_col, 'separation']
+        if frame.empty:
+            return pd.DataFrame(columns=columns)
+
+        game_id = frame[config.game_col].iloc[0]
+        play_id = frame[config.play_col].iloc[0]
+        frame_id = frame[config.frame_col].iloc[0]
+        player_ids = frame[config.player_id_col].to_numpy()
+        names = frame['player_name'].to_numpy() if 'player_name' in frame.columns else None
+        xy = frame[['x', 'y']].to_numpy(dtype=float)
+        speed = frame['s'].to_numpy(dtype=float)
+        slots = self._player_slots(game_id, play_id, player_ids, names)
+
+        seen = self._seen[slots]
+        steps = np.sqrt(np.sum((xy[seen] - self._last_xy[slots[seen]]) ** 2, axis=1))
+        np.add.at(self._distance, slots[seen], steps)
+        self._last_xy[slots] = xy
+        self._seen[slots] = True
+
+        has_speed = ~np.isnan(speed)
+        self._max_speed[slots] = np.fmax(self._max_speed[slots], speed)
+        np.add.at(self._speed_sum, slots[has_speed], speed[has_speed])
+        np.add.at(self._speed_count, slots[has_speed], 1)
+
+        sides = frame[config.player_side_col].to_numpy()
+        offense, defense = sides == 'Offense', sides == 'Defense'
+        if offense.any() and defense.any():
+            distances = np.sqrt(np.sum((xy[offense][:, None, :] - xy[defense][None, :, :]) ** 2, axis=-1))
+            min_distances = np.where(np.isnan(distances), np.inf, distances).min(axis=1)
+            valid = np.isfinite(min_distances)
+            separation = pd.DataFrame({
+                config.game_col: game_id,
+                config.play_col: play_id,
+                config.frame_col: frame_id,
+                config.player_id_col: player_ids[offense][valid],
+                'separation': min_distances[valid],
+            })
+        else:
+            separation = pd.DataFrame(columns=columns)
+
+        if self.keep_separation:
+            self._separation_frames.append(separation)
+        return separation
+
+    def consume(self, frames):
+        """Pushes every frame of an iterable of per-frame DataFrames, yielding each frame's separation."""
+        for frame in frames:
+            yield self.push(frame)
+
+    def _player_table(self, slots=None):
+        if slots is None:
+            slots = [slot for slot, key in enumerate(self._keys) if key is not None]
+        columns = [self.config.game_col, self.config.play_col, self.config.player_id_col]
+        keys = pd.DataFrame([self._keys[slot] for slot in slots], columns=columns)
+        return keys.assign(_slot=np.asarray(slots, dtype=int)).sort_values(columns, ignore_index=True)
+
+    def _add_distance(self, table):
+        table['total_distance'] = self._distance[table['_slot']]
+
+    def _add_speed_stats(self, table):
+        counts = self._speed_count[table['_slot']]
+        table['max_speed'] = self._max_speed[table['_slot']]
+        table['avg_speed'] = np.where(counts > 0, self._speed_sum[table['_slot']] / np.maximum(counts, 1), np.nan)
+
+    def _add_names(self, table):
+        names = np.asarray(self._names, dtype=object)[table['_slot']]
+        if any(name is not None for name in names):
+            table['player_name'] = names
+
+    def distance(self):
+        """Returns the cumulative distance per (game, play, player) of the plays not yet ended."""
+        table = self._player_table()
+        self._add_distance(table)
+        self._add_names(table)
+        return table.drop(columns='_slot')
+
+    def speed_stats(self):
+        """Returns the max and average speed per (game, play, player) of the plays not yet ended."""
+        table = self._player_table()
+        self._add_speed_stats(table)
+        self._add_names(table)
+        return table.drop(columns='_slot')
+
+    def end_play(self, game_id, play_id):
+        """
+        Returns the final distance and speed stats of a finished play and releases its players' state.
+
+        Returns:
+            pd.DataFrame: One row per player of the play with `total_distance`, `max_speed`, `avg_speed` and the
+            player's name. Empty if no frame of the play was pushed.
+        """
+        slots = self._play_slots.pop((game_id, play_id), [])
+        table = self._player_table(slots)
+        self._add_distance(table)
+        self._add_speed_stats(table)
+        self._add_names(table)
+
+        for slot in slots:
+            del self._slots[self._keys[slot]]
+            self._keys[slot] = None
+            self._names[slot] = None
+        self._free.extend(slots)
+        return table.drop(columns='_slot')
+
+    def separation(self):
+        """Returns the separation of every frame pushed so far. Requires `keep_separation=True`."""
+        if not self.keep_separation:
+            raise ValueError("Separation history is only kept with keep_separation=True.")
+        if not self._separation_frames:
+            config = self.config
+            return pd.DataFrame(columns=[config.game_col, config.play_col, config.frame_col, config.player_id_col, 'separation'])
+        return pd.concat(self._separation_frames, ignore_index=True)
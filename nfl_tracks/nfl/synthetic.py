@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+
+from .config import NFLTracksConfig
+
+_OFFENSE_POSITIONS = ['WR', 'QB', 'WR', 'TE', 'RB', 'WR']
+_DEFENSE_POSITIONS = ['CB', 'CB', 'FS', 'SS', 'ILB', 'OLB', 'CB']
+_TEAMS = ['KC', 'DET', 'BUF', 'PHI', 'SF', 'DAL', 'MIA', 'BAL', 'CIN', 'GB', 'NYJ', 'LAC', 'SEA', 'MIN', 'PIT', 'JAX']
+
+def generate_tracking_data(n_games: int = 1, n_plays: int = 1, n_frames: int = 50, n_offense: int = 6, n_defense: int = 7,
+                           seed: int = 0, config: NFLTracksConfig = NFLTracksConfig()):
+    """
+    Generates deterministic synthetic tracking data following the NFL Big Data Bowl 2026 input schema.
+
+    Every play has the same number of frames and players. Players start around a random line of scrimmage and move
+    with smoothly varying speed and direction at 10 frames per second, so distances, speeds and separations behave
+    like real data. The same arguments always produce the same data.
+
+    Returns:
+        pd.DataFrame: One row per (game, play, player, frame), sorted in that order like the BDB input files.
+    """
+    rng = np.random.default_rng(seed)
+    n_players = n_offense + n_defense
+    shape = (n_games, n_plays, n_players, n_frames)
+
+    los = rng.uniform(25, 95, size=(n_games, n_plays, 1, 1))
+    depth = np.concatenate([-rng.uniform(0, 7, n_offense), rng.uniform(1, 15, n_defense)])
+    start_x = los + depth[None, None, :, None] + rng.normal(0, 1, size=(n_games, n_plays, n_players, 1))
+    start_y = rng.uniform(5, 48.3, size=(n_games, n_plays, n_players, 1))
+
+    speed = np.clip(4 + np.cumsum(rng.normal(0, 0.4, size=shape), axis=-1), 0, 10)
+    direction = (rng.uniform(0, 360, size=(n_games, n_plays, n_players, 1)) + np.cumsum(rng.normal(0, 6, size=shape), axis=-1)) % 360
+    radians = np.deg2rad(direction)
+    x = start_x + np.cumsum(speed * np.sin(radians) * 0.1, axis=-1)
+    y = start_y + np.cumsum(speed * np.cos(radians) * 0.1, axis=-1)
+    accel = np.abs(np.diff(speed, axis=-1, prepend=speed[..., :1])) * 10
+    orientation = (direction + rng.normal(0, 15, size=shape)) % 360
+
+    game_idx, play_idx, player_idx, frame_idx = (axis.ravel() for axis in np.indices(shape))
+    is_offense = player_idx < n_offense
+    nfl_ids = 40000 + game_idx * n_players + player_idx
+    player_names = np.array([f"Player {40000 + i}" for i in range(n_games * n_players)], dtype=object)
+
+    roles = np.where(is_offense, 'Other Route Runner', 'Defensive Coverage').astype(object)
+    roles[player_idx == 0] = 'Targeted Receiver'
+    roles[player_idx == 1] = 'Passer'
+    positions = np.array([_OFFENSE_POSITIONS[i % len(_OFFENSE_POSITIONS)] for i in range(n_offense)]
+                         + [_DEFENSE_POSITIONS[i % len(_DEFENSE_POSITIONS)] for i in range(n_defense)])
+    ball_land_x = np.clip(los[:, :, 0, 0] + rng.uniform(5, 30, size=(n_games, n_plays)), 0, 120)
+    ball_land_y = rng.uniform(5, 48.3, size=(n_games, n_plays))
+    play_direction = np.where(rng.random((n_games, n_plays)) < 0.5, 'left', 'right')
+
+    return pd.DataFrame({
+        config.game_col: 2023090700 + game_idx,
+        config.play_col: 56 + play_idx * 25,
+        'player_to_predict': (player_idx == 0) | ~is_offense,
+        config.player_id_col: nfl_ids,
+        config.frame_col: frame_idx + 1,
+        'play_direction': play_direction[game_idx, play_idx],
+        'absolute_yardline_number': np.round(los[game_idx, play_idx, 0, 0]).astype(int),
+        'player_name': player_names[nfl_ids - 40000],
+        'player_height': '6-1',
+        'player_weight': 190 + (nfl_ids % 60),
+        'player_birth_date': '1998-01-01',
+        'player_position': positions[player_idx],
+        config.player_side_col: np.where(is_offense, 'Offense', 'Defense'),
+        'player_role': roles,
+        'x': x.ravel(),
+        'y': y.ravel(),
+        's': speed.ravel(),
+        'a': accel.ravel(),
+        'dir': direction.ravel(),
+        'o': orientation.ravel(),
+        'num_frames_output': n_frames,
+        'ball_land_x': ball_land_x[game_idx, play_idx],
+        'ball_land_y': ball_land_y[game_idx, play_idx],
+    })
+
+def generate_context_data(tracking_data: pd.DataFrame, seed: int = 0, config: NFLTracksConfig = NFLTracksConfig()):
+    """
+    Generates deterministic supplementary play context for every play in `tracking_data`.
+
+    Returns:
+        pd.DataFrame: One row per (game, play) with the columns read by the relay view.
+    """
+    rng = np.random.default_rng(seed)
+    plays = tracking_data[[config.game_col, config.play_col]].drop_duplicates().reset_index(drop=True)
+    game_codes = pd.factorize(plays[config.game_col])[0]
+    home = np.array(_TEAMS)[(2 * game_codes) % len(_TEAMS)]
+    visitor = np.array(_TEAMS)[(2 * game_codes + 1) % len(_TEAMS)]
+    home_has_ball = rng.random(len(plays)) < 0.5
+    home_wp = rng.uniform(0.05, 0.95, len(plays))
+
+    return plays.assign(
+        season=2023,
+        week=1,
+        game_date='09/07/2023',
+        game_time_eastern='20:20:00',
+        home_team_abbr=home,
+        visitor_team_abbr=visitor,
+        play_description='(Shotgun) Synthetic pass play.',
+        possession_team=np.where(home_has_ball, home, visitor),
+        defensive_team=np.where(home_has_ball, visitor, home),
+        pre_snap_home_score=rng.integers(0, 35, len(plays)),
+        pre_snap_visitor_score=rng.integers(0, 35, len(plays)),
+        pre_snap_home_team_win_probability=home_wp,
+        pre_snap_visitor_team_win_probability=1 - home_wp,
+    )
@@ -0,0 +1,145 @@
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pandas as pd
+
+from .config import NFLTracksConfig
+
+def _restore_track(values, state, shm=None):
+    track = PlayTrack.__new__(PlayTrack)
+    for slot, value in state.items():
+        setattr(track, slot, value)
+    track.values = values
+    track._shm = shm
+    track._owner = False
+    return track
+
+def _attach_track(name, shape, state):
+    shm = SharedMemory(name=name)
+    values = np.ndarray(shape, dtype=np.float32, buffer=shm.buf)
+    return _restore_track(values, state, shm)
+
+class PlayTrack:
+    """
+    A compact, array-backed copy of one play's tracking data.
+
+    Positions and kinematics are held in a single float32 tensor of shape frames x players x channels, with NaN
+    where a player is missing from a frame. Player ids, sides and names are stored once per player instead of once
+    per row. The tensor can be moved into shared memory with `to_shared_memory`, after which pickling the track
+    only sends the block name and the small lookup tables, and unpickling attaches to the same memory.
+
+    The per-player columns in `PLAYER_COLUMNS` and the per-play columns in `PLAY_COLUMNS` are kept in small lookup
+    tables as well, so `to_frame` restores them. Any other column of the play data is dropped.
+    """
+    __slots__ = ('game_id', 'play_id', 'frame_ids', 'player_ids', 'sides', 'names', 'player_to_predict', 'ball_land',
+                 'player_info', 'play_info', 'values', '_shm', '_owner')
+
+    CHANNELS = ('x', 'y', 's', 'a', 'dir', 'o')
+    PLAYER_COLUMNS = ('player_role', 'player_position', 'player_height', 'player_weight', 'player_birth_date')
+    PLAY_COLUMNS = ('play_direction', 'absolute_yardline_number')
+
+    def __init__(self, play_data: pd.DataFrame, config: NFLTracksConfig = NFLTracksConfig()):
+        if play_data.empty:
+            raise ValueError("Cannot build a PlayTrack from empty play data.")
+        if play_data[[config.game_col, config.play_col]].drop_duplicates().shape[0] > 1:
+            raise ValueError("PlayTrack holds a single play; the data contains several.")
+
+        self.game_id = play_data[config.game_col].iloc[0]
+        self.play_id = play_data[config.play_col].iloc[0]
+
+        frame_codes, self.frame_ids = pd.factorize(play_data[config.frame_col], sort=True)
+        player_codes, self.player_ids = pd.factorize(play_data[config.player_id_col])
+        self.frame_ids = np.asarray(self.frame_ids)
+        self.player_ids = np.asarray(self.player_ids)
+
+        first_rows = play_data.iloc[np.unique(player_codes, return_index=True)[1]]
+        self.sides = first_rows[config.player_side_col].astype(str).tolist()
+        self.names = first_rows['player_name'].astype(str).tolist() if 'player_name' in play_data.columns else None
+        self.player_to_predict = first_rows['player_to_predict'].to_numpy(dtype=bool) if 'player_to_predict' in play_data.columns else None
+        if 'ball_land_x' in play_data.columns and 'ball_land_y' in play_data.columns:
+            self.ball_land = (float(play_data['ball_land_x'].iloc[0]), float(play_data['ball_land_y'].iloc[0]))
+        else:
+            self.ball_land = None
+        self.player_info = {col: first_rows[col].to_numpy() for col in self.PLAYER_COLUMNS if col in play_data.columns}
+        self.play_info = {col: play_data[col].iloc[0] for col in self.PLAY_COLUMNS if col in play_data.columns}
+
+        self.values = np.full((len(self.frame_ids), len(self.player_ids), len(self.CHANNELS)), np.nan, dtype=np.float32)
+        for channel, col in enumerate(self.CHANNELS):
+            if col in play_data.columns:
+                self.values[frame_codes, player_codes, channel] = play_data[col].to_numpy(dtype=np.float32)
+        self._shm = None
+        self._owner = False
+
+    def __reduce__(self):
+        state = {slot: getattr(self, slot) for slot in self.__slots__ if slot not in ('values', '_shm', '_owner')}
+        if self._shm is not None:
+            return _attach_track, (self._shm.name, self.values.shape, state)
+        return _restore_track, (self.values, state)
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes
+
+    def channel(self, name: str):
+        """Returns one channel, e.g. 'x' or 's', as a frames x players array."""
+        return self.values[:, :, self.CHANNELS.index(name)]
+
+    def side_mask(self, side: str):
+        """Returns a boolean mask over the players of the given side."""
+        return np.array([player_side == side for player_side in self.sides])
+
+    def to_shared_memory(self):
+        """
+        Returns a copy of the track whose tensor lives in a new shared memory block.
+
+        The returned track owns the block; call `release` on it once every worker is done.
+        """
+        shm = SharedMemory(create=True, size=max(self.values.nbytes, 1))
+        values = np.ndarray(self.values.shape, dtype=np.float32, buffer=shm.buf)
+        values[:] = self.values
+        state = {slot: getattr(self, slot) for slot in self.__slots__ if slot not in ('values', '_shm', '_owner')}
+        track = _restore_track(values, state, shm)
+        track._owner = True
+        return track
+
+    def release(self):
+        """Detaches from the shared memory block, and frees it if this track created it."""
+        if self._shm is None:
+            return
+        self.values = self.values.copy()
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+        self._shm = None
+        self._owner = False
+
+    def to_frame(self, config: NFLTracksConfig = NFLTracksConfig()):
+        """
+        Expands the track back into long tracking data with one row per (frame, player) present in the play.
+
+        Returns:
+            pd.DataFrame: Tracking data using the column names of `config`.
+        """
+        frame_idx, player_idx = np.nonzero(~np.isnan(self.values[:, :, 0]))
+        data = {
+            config.game_col: np.full(len(frame_idx), self.game_id),
+            config.play_col: np.full(len(frame_idx), self.play_id),
+            config.frame_col: self.frame_ids[frame_idx],
+            config.player_id_col: self.player_ids[player_idx],
+            config.player_side_col: np.asarray(self.sides, dtype=object)[player_idx],
+        }
+        if self.names is not None:
+            data['player_name'] = np.asarray(self.names, dtype=object)[player_idx]
+        for channel, col in enumerate(self.CHANNELS):
+            values = self.values[frame_idx, player_idx, channel]
+            if not np.isnan(values).all():
+                data[col] = values
+        if self.player_to_predict is not None:
+            data['player_to_predict'] = self.player_to_predict[player_idx]
+        for col, values in self.player_info.items():
+            data[col] = values[player_idx]
+        for col, value in self.play_info.items():
+            data[col] = np.full(len(frame_idx), value)
+        if self.ball_land is not None:
+            data['ball_land_x'], data['ball_land_y'] = self.ball_land
+        return pd.DataFrame(data)
@@ -1,24 +1,58 @@
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
+import matplotlib.colors as mcolors
 import matplotlib.animation as animation
 import matplotlib.patches as patches
 import matplotlib.image as mimage
 from matplotlib.offsetbox import AnnotationBbox, OffsetImage
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.gridspec import GridSpec, GridSpecFromSubplotSpec
 import inspect
+from functools import lru_cache
+import os
 import urllib.request
 from datetime import datetime
 from io import BytesIO
-from IPython.display import HTML
 
+from . import profiling
 from .config import NFLTracksConfig
-
-def _draw_field_on_axes(ax, yard_numbers=True, touchdown_markings=True, fifty_yard=False):
-    """Helper to draw a football field on a given matplotlib Axes object."""
+from .store import TrackingStore
+from .track import PlayTrack
+from .encoding import StreamingGifWriter, build_html_player
+
+DEFAULT_BALL_IMAGE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ball.png')
+
+_YARD_LINE_SEGMENTS = [[(x, 0), (x, 53.3)] for x in range(20, 110, 10)]
+_SIDELINE_HASH_SEGMENTS = [[(x, 0.4), (x, 0.7)] for x in range(11, 110)] + [[(x, 53.0), (x, 52.5)] for x in range(11, 110)]
+_INNER_HASH_SEGMENTS = [[(x, y0), (x, y1)] for x in range(11, 110) if x % 5 != 0 for y0, y1 in ((22.91, 23.57), (29.73, 30.39))]
+
+@profiling.timed('field.draw')
+def _draw_field_on_axes(ax, yard_numbers=True, touchdown_markings=True, fifty_yard=False, raster=False, raster_dpi=None):
+    """
+    Helper to draw a football field on a given matplotlib Axes object.
+
+    Yard lines and hash marks are drawn as three line collections instead of one line per mark. With `raster=True`
+    the whole field is drawn as a single cached image sized to the axes, see `_get_field_raster`. The image is
+    rendered at `raster_dpi` (default: the figure dpi); it is only pixel-exact when the figure is saved at that dpi,
+    so pass the save dpi when it differs.
+    """
     ax.set_xlim(0, 120)
     ax.set_ylim(0, 53.3)
     ax.axis("off")
 
+    if raster:
+        dpi = raster_dpi or ax.figure.dpi
+        bbox = ax.get_window_extent()
+        scale = dpi / ax.figure.dpi
+        image = _get_field_raster(yard_numbers, touchdown_markings, fifty_yard, int(round(bbox.width * scale)), int(round(bbox.height * scale)), dpi)
+        ax.imshow(image, extent=(0, 120, 0, 53.3), aspect='auto', interpolation='nearest', zorder=0)
+        ax.set_xlim(0, 120)
+        ax.set_ylim(0, 53.3)
+        return
+
     ax.add_patch(patches.Rectangle((0, 0), 120, 53.3, fc='#166f29', zorder=0))
     ax.add_patch(patches.Rectangle((0, 0), 10, 53.3, fc='#0b541c', zorder=1))
     ax.add_patch(patches.Rectangle((110, 0), 10, 53.3, fc='#0b541c', zorder=1))
@@ -26,8 +60,7 @@ def _draw_field_on_axes(ax, yard_numbers=True, touchdown_markings=True, fifty_ya
         ax.text(5, 53.3 / 2, 'Touchdown', ha='center', va='center', fontsize=20, fontweight='bold', color='white', rotation=90)
         ax.text(115, 53.3 / 2, 'Touchdown', ha='center', va='center', fontsize=20, fontweight='bold', color='white', rotation=270)
 
-    for x in range(20, 110, 10):
-        ax.plot([x, x], [0, 53.3], color='white', alpha=0.7, lw=1)
+    ax.add_collection(LineCollection(_YARD_LINE_SEGMENTS, colors='white', alpha=0.7, linewidths=1, capstyle='projecting'), autolim=False)
     if fifty_yard:
         ax.plot([60, 60], [0, 53.3], color='gold', lw=2)
 
@@ -37,37 +70,133 @@ def _draw_field_on_axes(ax, yard_numbers=True, touchdown_markings=True, fifty_ya
             ax.text(x-0.6, 3, str(yard_num - 10), ha='center', fontsize=12, color='white')
             ax.text(x-0.6, 53.3 - 3, str(yard_num - 10), ha='center', fontsize=12, color='white', rotation=180)
 
-    for x in range(11, 110):
-        ax.plot([x, x], [0.4, 0.7], color='white', lw=1)
-        ax.plot([x, x], [53.0, 52.5], color='white', lw=1)
-        if x % 5 != 0:
-            ax.plot([x, x], [22.91, 23.57], color='white', alpha=0.5, lw=1)
-            ax.plot([x, x], [29.73, 30.39], color='white', alpha=0.5, lw=1)
+    ax.add_collection(LineCollection(_SIDELINE_HASH_SEGMENTS, colors='white', linewidths=1, capstyle='projecting'), autolim=False)
+    ax.add_collection(LineCollection(_INNER_HASH_SEGMENTS, colors='white', alpha=0.5, linewidths=1, capstyle='projecting'), autolim=False)
 
+@lru_cache(maxsize=16)
+def _get_field_raster(yard_numbers, touchdown_markings, fifty_yard, width, height, dpi):
+    """
+    Renders the field once into an RGBA array of the given pixel size and caches it for the process.
 
-def field(yard_numbers=True, touchdown_markings=True, fifty_yard=False, fig_size=(12, 6.33)):
+    The axes pixel size is fully determined by the figure size, layout and dpi, so plots sharing those settings reuse
+    the same raster instead of rebuilding every field artist.
+    """
+    fig = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_axes((0, 0, 1, 1))
+    _draw_field_on_axes(ax, yard_numbers, touchdown_markings, fifty_yard)
+    canvas.draw()
+    image = np.asarray(canvas.buffer_rgba()).copy()
+    image.setflags(write=False)
+    return image
+
+@lru_cache(maxsize=8)
+def _load_image(path, allow_network=True):
+    """
+    Reads and decodes an image from a local path or URL, at most once per process for each path.
+
+    The decoded array is shared between callers, so it is returned read-only. Failed loads are not cached.
+    """
+    if path.startswith('http'):
+        if not allow_network:
+            raise RuntimeError(f"Network access is disabled, cannot fetch {path}")
+        with urllib.request.urlopen(path, timeout=10) as req:
+            img = mimage.imread(BytesIO(req.read()))
+    else:
+        img = mimage.imread(path)
+    img.setflags(write=False)
+    return img
+
+def _notebook_html(html):
+    # IPython is only needed, and only imported, when returning output for notebook display.
+    from IPython.display import HTML
+    return HTML(html)
+
+@profiling.timed('field')
+def field(yard_numbers=True, touchdown_markings=True, fifty_yard=False, fig_size=(12, 6.33), raster=False, raster_dpi=None):
     """Generates a plot of a standard American football field."""
     fig, ax = plt.subplots(1, figsize=fig_size)
-    _draw_field_on_axes(ax, yard_numbers, touchdown_markings, fifty_yard)
+    _draw_field_on_axes(ax, yard_numbers, touchdown_markings, fifty_yard, raster, raster_dpi)
     return fig, ax
 
 class Play:
-    def __init__(self, data: pd.DataFrame, gameId: int, playId: int, context_data: pd.DataFrame = None, config: NFLTracksConfig = NFLTracksConfig(), ball_image_path: str = None):
+    def __init__(self, data: pd.DataFrame, gameId: int = None, playId: int = None, context_data: pd.DataFrame = None, config: NFLTracksConfig = NFLTracksConfig(), ball_image_path: str = None, allow_network: bool = True):
         self.config = config
+        if isinstance(data, PlayTrack):
+            gameId = data.game_id if gameId is None else gameId
+            playId = data.play_id if playId is None else playId
         self.gameId = gameId
         self.playId = playId
-        self.data = data[(data[self.config.game_col] == gameId) & (data[self.config.play_col] == playId)].copy()
+        self._context_info = None
+        with profiling.phase('play.select_data'):
+            if isinstance(data, PlayTrack):
+                if (gameId, playId) != (data.game_id, data.play_id):
+                    raise ValueError(f"No data found for gameId={gameId} and playId={playId}.")
+                self.data = data.to_frame(self.config)
+            elif isinstance(data, TrackingStore):
+                self.config = data.config
+                self.data = data.play_data(gameId, playId)
+                if context_data is None:
+                    context_data = data.context_data
+                    self._context_info = data.context(gameId, playId)
+            else:
+                self.data = data[(data[self.config.game_col] == gameId) & (data[self.config.play_col] == playId)].copy()
         if self.data.empty:
             raise ValueError(f"No data found for gameId={gameId} and playId={playId}.")
         self.context_data = context_data
-        self.ball_image_path = ball_image_path or "https://i.postimg.cc/c44XYZ8F/ball.png"
-
-    def _get_colorized_frame_data(self, frameId: int, club_colors: dict = None):
-        frame_data = self.data[self.data[self.config.frame_col] == frameId].copy()
+        self.ball_image_path = ball_image_path or DEFAULT_BALL_IMAGE_PATH
+        self.allow_network = allow_network
+        self._frame_arrays_cache = {}
+
+    @profiling.timed('play.frame_arrays')
+    def _get_frame_arrays(self, club_colors: dict = None):
+        """
+        Returns frame-ordered player arrays for the play, built once per color scheme.
+
+        Rows are sorted by frame so each frame is the contiguous range `bounds[i]:bounds[i + 1]` of the `xy`,
+        `colors` and `player_ids` arrays, and drawing a frame is a constant-time slice.
+        """
         default_club_colors = {"Offense": "red", "Defense": "blue"}
         final_colors = {**default_club_colors, **(club_colors or {})}
-        frame_data['plot_color'] = frame_data[self.config.player_side_col].map(final_colors)
-        return frame_data
+        # Colors may be unhashable (e.g. RGB lists), so the key holds their RGBA tuples.
+        cache_key = tuple(sorted((side, mcolors.to_rgba(color)) for side, color in final_colors.items()))
+        if cache_key in self._frame_arrays_cache:
+            return self._frame_arrays_cache[cache_key]
+
+        frame_ids = self.data[self.config.frame_col].to_numpy()
+        order = np.argsort(frame_ids, kind='stable')
+        frames, starts = np.unique(frame_ids[order], return_index=True)
+
+        sides = self.data[self.config.player_side_col].to_numpy().astype(str)[order]
+        side_names, side_codes = np.unique(sides, return_inverse=True)
+        palette = mcolors.to_rgba_array([final_colors.get(side, 'gray') for side in side_names])
+
+        arrays = {
+            'frames': frames,
+            'bounds': np.r_[starts, len(order)],
+            'xy': self.data[['x', 'y']].to_numpy(dtype=float)[order],
+            'colors': palette[side_codes],
+            'palette': palette,
+            'color_codes': side_codes,
+            'player_ids': self.data[self.config.player_id_col].to_numpy()[order],
+        }
+        self._frame_arrays_cache[cache_key] = arrays
+        return arrays
+
+    def _get_highlight_rows(self, arrays, player_id):
+        """Returns, for every frame, the row of the highlighted player in the frame arrays, or -1 if absent."""
+        highlight_rows = np.full(len(arrays['frames']), -1)
+        if player_id:
+            rows = np.flatnonzero(arrays['player_ids'] == player_id)
+            frame_idx = np.searchsorted(arrays['bounds'], rows, side='right') - 1
+            highlight_rows[frame_idx[::-1]] = rows[::-1]
+        return highlight_rows
+
+    def _get_frame_slice(self, arrays, frameId):
+        frame_idx = np.searchsorted(arrays['frames'], frameId)
+        if frame_idx == len(arrays['frames']) or arrays['frames'][frame_idx] != frameId:
+            return None, slice(0, 0)
+        return frame_idx, slice(arrays['bounds'][frame_idx], arrays['bounds'][frame_idx + 1])
 
     def _split_kwargs(self, kwargs):
         field_args = inspect.signature(field).parameters
@@ -86,177 +215,76 @@ class Play:
 
         return None
 
+    @profiling.timed('play.ball_image')
     def _draw_ball_image(self, ax):
         ball_x = self.data['ball_land_x'].iloc[0]
         ball_y = self.data['ball_land_y'].iloc[0]
         try:
-            if self.ball_image_path.startswith('http'):
-                with urllib.request.urlopen(self.ball_image_path) as req:
-                    img_data = req.read()
-                    img_stream = BytesIO(img_data)
-                    img = mimage.imread(img_stream)
-            else:
-                img = mimage.imread(self.ball_image_path)
-
+            img = _load_image(self.ball_image_path, self.allow_network)
             imagebox = OffsetImage(img, zoom=0.05)
             ab = AnnotationBbox(imagebox, (ball_x, ball_y), frameon=False, zorder=5, annotation_clip=False)
             ax.add_artist(ab)
+            return ab
         except Exception as e:
             print(f"Failed to load ball image: {e}")
-            ax.scatter(ball_x, ball_y, c='saddlebrown', s=50, marker='o', zorder=5, clip_on=False)
-
-
-    def _draw_header_and_footer(self, field_ax, context_info):
-
-        # Axes-level Header
-        season = context_info.get('season', 'N/A')
-        week = context_info.get('week', 'N/A')
-        game_date_str = context_info.get('game_date', 'N/A')
-        game_time_str = context_info.get('game_time_eastern', 'N/A')
-
-        try:
-            game_date = datetime.strptime(game_date_str, '%m/%d/%Y').strftime('%d/%m/%Y')
-        except (ValueError, TypeError):
-            game_date = game_date_str
-
-        field_ax.text(0, 55.3, f"{self.gameId}    {self.playId}", fontsize=12, color='black')
-        field_ax.text(120, 55.3, f"{season} - Week {week}     {game_date}    {game_time_str}", fontsize=12, color='black', ha='right')
-
-        play_desc = context_info.get('play_description', 'N/A')
-        field_ax.text(60, -3, play_desc, ha='center', fontsize=12, style='italic', color='black',
-                      bbox=dict(facecolor='white', alpha=0.5), zorder=6)
+            return ax.scatter(ball_x, ball_y, c='saddlebrown', s=50, marker='o', zorder=5, clip_on=False)
 
-
-    def _draw_scoreboard(self, ax, context):
-        ax.set_ylim(0, 1)
-        fig = ax.get_figure()
-        ax.axis('off')
-
-        gs = GridSpecFromSubplotSpec(2, 1, subplot_spec=ax.get_subplotspec(), hspace=0.1)
-        ax_off = fig.add_subplot(gs[0])
-        ax_def = fig.add_subplot(gs[1])
-
-        poss_team = context['possession_team']
-        def_team = context['defensive_team']
-
-        if poss_team == context['home_team_abbr']:
-            off_score = context['pre_snap_home_score']
-            def_score = context['pre_snap_visitor_score']
-            off_wp = context['pre_snap_home_team_win_probability']
-            def_wp = context['pre_snap_visitor_team_win_probability']
-        else:
-            off_score = context['pre_snap_visitor_score']
-            def_score = context['pre_snap_home_score']
-            off_wp = context['pre_snap_visitor_team_win_probability']
-            def_wp = context['pre_snap_home_team_win_probability']
-
-        ax_team_board = {
-            "ax_off": { "obj": ax_off, "team": poss_team, "score": off_score, "wp": off_wp, "bg_color": '#ffadad', "border_color": 'red', "pos": "O" },
-            "ax_def": { "obj": ax_def, "team": def_team, "score": def_score, "wp": def_wp, "bg_color": '#a1dbe3', "border_color": 'blue', "pos": "D" }
-        }
-
-        for team in ax_team_board:
-            ax_team = ax_team_board[team]
-            ax_team_obj = ax_team['obj']
-            ax_team_obj.set_xlim(0, 1)
-            ax_team_obj.set_ylim(0, 1)
-            ax_team_obj.axis('off')
-
-            ax_team_obj.add_patch(patches.Rectangle((0.0, 0), 1, 1, facecolor=ax_team['bg_color'], edgecolor=ax_team['border_color'], lw=1.5))
-            ax_team_obj.text(0.1, 0.85, f"Team: {ax_team['team']}", ha='left', color='black', weight='bold', fontsize=12)
-            ax_team_obj.text(0.5, 0.45, str(ax_team['score']), ha='center', color='black', fontsize=36)
-            ax_team_obj.text(0.5, 0.35, "Score", ha='center', color='black', weight='bold', fontsize=10)
-            ax_team_obj.text(0.1, 0.05, f"{ax_team['wp']*100:.0f}%", color='black', fontsize=10)
-            ax_team_obj.add_patch(patches.Rectangle((0.8, 0.05), 0.1, 0.1, facecolor='#5e17eb', edgecolor='#ffde59'))
-            ax_team_obj.text(0.85, 0.1, ax_team['pos'], ha='center', va='center', fontsize=8, color='white')
-
-
-    def _draw_player_details(self, ax, player_info):
-        ax.set_xlim(0, 1)
-        ax.set_ylim(0, 1)
-        ax.axis('off')
-
-        ax.add_patch(patches.Rectangle((0, 0), 1, 1, facecolor='lightgray', edgecolor='black', lw=1.5))
-        ax.text(0.5, 0.90, "Highlighted", ha='center', weight='bold', fontsize=14)
-        ax.text(0.5, 0.83, "Player", ha='center', weight='bold', fontsize=14)
-
-        details = {
-            "Name": player_info.get('player_name', 'N/A'),
-            "Role": player_info.get('player_role', 'N/A'),
-            "Height": player_info.get('player_height', 'N/A'),
-            "Weight": player_info.get('player_weight', 'N/A'),
-            "DOB": player_info.get('player_birth_date', 'N/A'),
-            "Position": player_info.get('player_position', 'N/A')
-        }
-
-        y_pos = 0.7
-        for key, value in details.items():
-            ax.text(0.5, y_pos, f"{key}", weight='bold', fontsize=10, ha="center")
-            ax.text(0.5, y_pos-0.04, str(value), fontsize=10, ha="center")
-            y_pos -= 0.12
-
-
-    def _setup_relay_figure(self, highlight_player_id_arg):
+    def _get_context_info(self):
         if self.context_data is None:
             raise ValueError("Context data must be provided for relay view.")
+        if self._context_info is not None:
+            return self._context_info
+        return self.context_data[(self.context_data[self.config.game_col] == self.gameId) & (self.context_data[self.config.play_col] == self.playId)].iloc[0]
+
+    def _setup_relay_figure(self, highlight_player_id_arg, field_kwargs=None):
+        self._get_context_info()
+        template = RelayTemplate(**(field_kwargs or {}))
+        final_highlight_id = template.set_play(self, highlight_player_id_arg)
+        return template.fig, template.ax_field, final_highlight_id
+
+    @profiling.timed('plot_snap')
+    def plot_snap(self, frameId: int, save: bool = False, filename: str = None, relay: bool = False, highlight_player_id: int = None, template: 'RelayTemplate' = None, **kwargs):
+        field_kwargs, snap_kwargs = self._split_kwargs(kwargs)
+        if save and field_kwargs.get('raster'):
+            # Render the field raster at the dpi the snapshot is saved at, so it is not resampled.
+            field_kwargs.setdefault('raster_dpi', kwargs.get('dpi', 150))
 
-
-        fig = plt.figure(figsize=(18, 6.33))
-        fig.subplots_adjust(left=0.05, right=0.95)
-        gs = GridSpec(1, 3, figure=fig, width_ratios=[2, 12, 2.5], wspace=0.05)
-
-        ax_score = fig.add_subplot(gs[0, 0])
-        ax_field = fig.add_subplot(gs[0, 1])
-        ax_details = fig.add_subplot(gs[0, 2])
-
-        final_highlight_id = self._determine_highlight_player_id(highlight_player_id_arg)
-        context_info = self.context_data[(self.context_data[self.config.game_col] == self.gameId) & (self.context_data[self.config.play_col] == self.playId)].iloc[0]
-
-        # Draw UI elements
-        self._draw_header_and_footer(ax_field, context_info)
-        self._draw_scoreboard(ax_score, context_info)
-
-        if final_highlight_id:
-            player_info_df = self.data[self.data[self.config.player_id_col] == final_highlight_id]
-            if not player_info_df.empty:
-                self._draw_player_details(ax_details, player_info_df.iloc[0])
-        else:
-            ax_details.axis('off')
-
-        return fig, ax_field, final_highlight_id
-
-    def plot_snap(self, frameId: int, save: bool = False, filename: str = None, relay: bool = False, highlight_player_id: int = None, **kwargs):
         if not relay:
-            field_kwargs, snap_kwargs = self._split_kwargs(kwargs)
             fig, ax = field(**field_kwargs)
 
-            player_data = self._get_colorized_frame_data(frameId, snap_kwargs.get('club_colors'))
-            ax.scatter(player_data.x, player_data.y, c=player_data['plot_color'], s=snap_kwargs.get('size', 30), clip_on=False)
+            arrays = self._get_frame_arrays(snap_kwargs.get('club_colors'))
+            _, rows = self._get_frame_slice(arrays, frameId)
+            ax.scatter(arrays['xy'][rows, 0], arrays['xy'][rows, 1], c=arrays['colors'][rows], s=snap_kwargs.get('size', 30), clip_on=False)
             self._draw_ball_image(ax)
         else:
-            fig, ax_field, final_highlight_id = self._setup_relay_figure(highlight_player_id)
-            field_kwargs, snap_kwargs = self._split_kwargs(kwargs)
-
-            _draw_field_on_axes(ax_field, **field_kwargs)
-
-            player_data = self._get_colorized_frame_data(frameId, snap_kwargs.get('club_colors'))
-            ax_field.scatter(player_data.x, player_data.y, c=player_data['plot_color'], s=snap_kwargs.get('size', 30), clip_on=False)
-
-            if final_highlight_id:
-                p_info = player_data[player_data[self.config.player_id_col] == final_highlight_id]
-                if not p_info.empty:
-                    ax_field.scatter(p_info.x, p_info.y, s=100, facecolors='none', edgecolors='yellow', lw=1.5, clip_on=False)
-
-            self._draw_ball_image(ax_field)
-            ax = ax_field
+            if template is None:
+                self._get_context_info()
+                template = RelayTemplate(**field_kwargs)
+            fig, ax = template.render(self, frameId, highlight_player_id, snap_kwargs.get('club_colors'), snap_kwargs.get('size', 30))
 
         if save:
             fname = filename or f"{self.gameId}_{self.playId}_frame_{frameId}.png"
-            fig.savefig(fname, dpi=kwargs.get('dpi', 150))
+            with profiling.phase('plot_snap.save'):
+                fig.savefig(fname, dpi=kwargs.get('dpi', 150))
+            profiling.count('bytes_encoded', os.path.getsize(fname))
             print(f"Snap saved to {fname}")
 
+        profiling.count('frames_rendered')
         return fig, ax
 
+    def _build_html_player(self, fig, ax, arrays, highlight_rows, interval):
+        bounds = arrays['bounds']
+        frame_rows = [slice(bounds[i], bounds[i + 1]) for i in range(len(arrays['frames']))]
+        return build_html_player(
+            fig, ax,
+            frames_xy=[arrays['xy'][rows] for rows in frame_rows],
+            color_codes=[arrays['color_codes'][rows] for rows in frame_rows],
+            palette=[mcolors.to_hex(color) for color in arrays['palette']],
+            highlight_rows=[row - rows.start if row >= 0 else -1 for row, rows in zip(highlight_rows, frame_rows)],
+            interval=interval,
+        )
+
+    @profiling.timed('animate')
     def animate(self, save: bool = False, filename: str = None, relay: bool = False, highlight_player_id: int = None, kaggle=True, **kwargs):
         field_kwargs, animate_kwargs = self._split_kwargs(kwargs)
 
@@ -265,43 +293,267 @@ class Play:
             self._draw_ball_image(ax)
             final_highlight_id = self._determine_highlight_player_id(highlight_player_id)
         else:
-            fig, ax, final_highlight_id = self._setup_relay_figure(highlight_player_id)
-            _draw_field_on_axes(ax, **field_kwargs)
+            fig, ax, final_highlight_id = self._setup_relay_figure(highlight_player_id, field_kwargs)
             self._draw_ball_image(ax)
 
-        frames = sorted(self.data[self.config.frame_col].unique())
+        arrays = self._get_frame_arrays(animate_kwargs.get('club_colors'))
+        frames, bounds, xy, colors = arrays['frames'], arrays['bounds'], arrays['xy'], arrays['colors']
+        highlight_rows = self._get_highlight_rows(arrays, final_highlight_id)
         marker_size = animate_kwargs.get('size', 30)
 
+        html = None
+        if kaggle and animate_kwargs.get('html_player'):
+            # Built before any player artist exists, so the background only holds the field.
+            with profiling.phase('animate.html_player'):
+                html = self._build_html_player(fig, ax, arrays, highlight_rows, animate_kwargs.get('speed', 100))
+            profiling.count('bytes_encoded', len(html))
+            if not save:
+                plt.close(fig)
+                return _notebook_html(html)
+
         player_scatter = ax.scatter([], [], s=100, zorder=3, clip_on=False)
         highlight_marker = ax.scatter([], [], s=100, facecolors='none', edgecolors='yellow', lw=2.5, zorder=4, clip_on=False)
 
+        @profiling.timed('animate.frame_update')
         def update(frame_idx):
-            frame_id = frames[frame_idx]
-            player_data = self._get_colorized_frame_data(frame_id, animate_kwargs.get('club_colors'))
-            player_scatter.set_offsets(player_data[['x', 'y']])
-            player_scatter.set_color(player_data['plot_color'])
+            rows = slice(bounds[frame_idx], bounds[frame_idx + 1])
+            player_scatter.set_offsets(xy[rows])
+            player_scatter.set_color(colors[rows])
 
             elements = [player_scatter]
 
             if final_highlight_id:
-                p_info = player_data[player_data[self.config.player_id_col] == final_highlight_id]
-                if not p_info.empty:
-                    highlight_marker.set_offsets(p_info[['x', 'y']])
+                highlight_row = highlight_rows[frame_idx]
+                if highlight_row >= 0:
+                    highlight_marker.set_offsets(xy[highlight_row:highlight_row + 1])
                 elements.append(highlight_marker)
 
+            profiling.count('frames_rendered')
             return tuple(elements)
 
         ani = animation.FuncAnimation(fig, update, frames=len(frames), interval=animate_kwargs.get('speed', 100), blit=True)
 
         if save:
             fname = filename or f"Anim_{self.gameId}_{self.playId}.gif"
-            writer = animation.PillowWriter(fps=animate_kwargs.get('fps', 15))
-            ani.save(fname, writer=writer)
+            fps = animate_kwargs.get('fps', 15)
+            writer = animate_kwargs.get('writer')
+            if writer is None:
+                writer = StreamingGifWriter(fps=fps) if fname.lower().endswith('.gif') else animation.FFMpegWriter(fps=fps)
+            with profiling.phase('animate.encode'):
+                ani.save(fname, writer=writer)
+            profiling.count('bytes_encoded', os.path.getsize(fname))
             print(f"Animation saved to {fname}")
 
+        if html is not None:
+            plt.close(fig)
+            return _notebook_html(html)
+
         if kaggle:
             plt.close(fig)
-            return HTML(ani.to_jshtml())
+            with profiling.phase('animate.to_jshtml'):
+                html = ani.to_jshtml()
+            profiling.count('bytes_encoded', len(html))
+            return _notebook_html(html)
 
         return ani
 
+
+
+_PLAYER_CARD_FIELDS = {
+    "Name": 'player_name',
+    "Role": 'player_role',
+    "Height": 'player_height',
+    "Weight": 'player_weight',
+    "DOB": 'player_birth_date',
+    "Position": 'player_position',
+}
+
+class RelayTemplate:
+    """
+    Relay dashboard figure that is laid out once and refilled for each play.
+
+    The figure, GridSpec, scoreboard panels, player card and field are built in the constructor. `set_play` and
+    `render` then only update the changing artists: scoreboard, header and footer texts, player card values, player
+    scatter, highlight marker and ball. Rendering many relay snapshots through one template costs little more than
+    drawing the players of each play.
+
+        template = RelayTemplate()
+        for game_id, play_id, frame_id in jobs:
+            Play(store, game_id, play_id).plot_snap(frame_id, relay=True, save=True, template=template)
+    """
+    @profiling.timed('relay.setup')
+    def __init__(self, yard_numbers=True, touchdown_markings=True, fifty_yard=False, raster=False, raster_dpi=None):
+        self.fig = plt.figure(figsize=(18, 6.33))
+        self.fig.subplots_adjust(left=0.05, right=0.95)
+        gs = GridSpec(1, 3, figure=self.fig, width_ratios=[2, 12, 2.5], wspace=0.05)
+
+        ax_score = self.fig.add_subplot(gs[0, 0])
+        self.ax_field = self.fig.add_subplot(gs[0, 1])
+        self.ax_details = self.fig.add_subplot(gs[0, 2])
+
+        self._header_play = self.ax_field.text(0, 55.3, "", fontsize=12, color='black')
+        self._header_game = self.ax_field.text(120, 55.3, "", fontsize=12, color='black', ha='right')
+        self._footer = self.ax_field.text(60, -3, "", ha='center', fontsize=12, style='italic', color='black',
+                                          bbox=dict(facecolor='white', alpha=0.5), zorder=6)
+        self._build_scoreboard(ax_score)
+        self._build_player_card(self.ax_details)
+        _draw_field_on_axes(self.ax_field, yard_numbers, touchdown_markings, fifty_yard, raster, raster_dpi)
+
+        self._player_scatter = None
+        self._highlight_marker = None
+        self._ball = None
+        self._ball_image_path = None
+
+    def _build_scoreboard(self, ax):
+        ax.set_ylim(0, 1)
+        ax.axis('off')
+
+        gs = GridSpecFromSubplotSpec(2, 1, subplot_spec=ax.get_subplotspec(), hspace=0.1)
+        team_axes = [self.fig.add_subplot(gs[0]), self.fig.add_subplot(gs[1])]
+
+        self._scoreboard = {}
+        for ax_team, (pos, bg_color, border_color) in zip(team_axes, [("O", '#ffadad', 'red'), ("D", '#a1dbe3', 'blue')]):
+            ax_team.set_xlim(0, 1)
+            ax_team.set_ylim(0, 1)
+            ax_team.axis('off')
+
+            ax_team.add_patch(patches.Rectangle((0.0, 0), 1, 1, facecolor=bg_color, edgecolor=border_color, lw=1.5))
+            team = ax_team.text(0.1, 0.85, "", ha='left', color='black', weight='bold', fontsize=12)
+            score = ax_team.text(0.5, 0.45, "", ha='center', color='black', fontsize=36)
+            ax_team.text(0.5, 0.35, "Score", ha='center', color='black', weight='bold', fontsize=10)
+            wp = ax_team.text(0.1, 0.05, "", color='black', fontsize=10)
+            ax_team.add_patch(patches.Rectangle((0.8, 0.05), 0.1, 0.1, facecolor='#5e17eb', edgecolor='#ffde59'))
+            ax_team.text(0.85, 0.1, pos, ha='center', va='center', fontsize=8, color='white')
+            self._scoreboard[pos] = (team, score, wp)
+
+    def _build_player_card(self, ax):
+        ax.set_xlim(0, 1)
+        ax.set_ylim(0, 1)
+        ax.axis('off')
+
+        self._card_artists = [
+            ax.add_patch(patches.Rectangle((0, 0), 1, 1, facecolor='lightgray', edgecolor='black', lw=1.5)),
+            ax.text(0.5, 0.90, "Highlighted", ha='center', weight='bold', fontsize=14),
+            ax.text(0.5, 0.83, "Player", ha='center', weight='bold', fontsize=14),
+        ]
+        self._card_values = {}
+        y_pos = 0.7
+        for key, column in _PLAYER_CARD_FIELDS.items():
+            self._card_artists.append(ax.text(0.5, y_pos, f"{key}", weight='bold', fontsize=10, ha="center"))
+            self._card_values[column] = ax.text(0.5, y_pos-0.04, "", fontsize=10, ha="center")
+            self._card_artists.append(self._card_values[column])
+            y_pos -= 0.12
+
+    def _set_header_and_footer(self, play, context_info):
+        season = context_info.get('season', 'N/A')
+        week = context_info.get('week', 'N/A')
+        game_date_str = context_info.get('game_date', 'N/A')
+        game_time_str = context_info.get('game_time_eastern', 'N/A')
+
+        try:
+            game_date = datetime.strptime(game_date_str, '%m/%d/%Y').strftime('%d/%m/%Y')
+        except (ValueError, TypeError):
+            game_date = game_date_str
+
+        self._header_play.set_text(f"{play.gameId}    {play.playId}")
+        self._header_game.set_text(f"{season} - Week {week}     {game_date}    {game_time_str}")
+        self._footer.set_text(context_info.get('play_description', 'N/A'))
+
+    def _set_scoreboard(self, context):
+        poss_team = context['possession_team']
+        def_team = context['defensive_team']
+
+        if poss_team == context['home_team_abbr']:
+            off_score = context['pre_snap_home_score']
+            def_score = context['pre_snap_visitor_score']
+            off_wp = context['pre_snap_home_team_win_probability']
+            def_wp = context['pre_snap_visitor_team_win_probability']
+        else:
+            off_score = context['pre_snap_visitor_score']
+            def_score = context['pre_snap_home_score']
+            off_wp = context['pre_snap_visitor_team_win_probability']
+            def_wp = context['pre_snap_home_team_win_probability']
+
+        for pos, team_name, score_value, wp_value in [("O", poss_team, off_score, off_wp), ("D", def_team, def_score, def_wp)]:
+            team, score, wp = self._scoreboard[pos]
+            team.set_text(f"Team: {team_name}")
+            score.set_text(str(score_value))
+            wp.set_text(f"{wp_value*100:.0f}%")
+
+    def _set_player_card(self, player_info):
+        for artist in self._card_artists:
+            artist.set_visible(player_info is not None)
+        if player_info is not None:
+            for column, text in self._card_values.items():
+                text.set_text(str(player_info.get(column, 'N/A')))
+
+    @profiling.timed('relay.set_play')
+    def set_play(self, play: Play, highlight_player_id: int = None):
+        """
+        Fills the scoreboard, header, footer and player card with the context of `play`.
+
+        Returns:
+            The `nfl_id` of the highlighted player, or None.
+        """
+        context_info = play._get_context_info()
+        self._set_header_and_footer(play, context_info)
+        self._set_scoreboard(context_info)
+
+        final_highlight_id = play._determine_highlight_player_id(highlight_player_id)
+        player_info = None
+        if final_highlight_id:
+            player_info_df = play.data[play.data[play.config.player_id_col] == final_highlight_id]
+            if not player_info_df.empty:
+                player_info = player_info_df.iloc[0]
+        self._set_player_card(player_info)
+        return final_highlight_id
+
+    def _set_ball(self, play):
+        if self._ball is not None and self._ball_image_path != play.ball_image_path:
+            self._ball.remove()
+            self._ball = None
+        if self._ball is None:
+            self._ball = play._draw_ball_image(self.ax_field)
+            self._ball_image_path = play.ball_image_path
+            return
+
+        ball_xy = (play.data['ball_land_x'].iloc[0], play.data['ball_land_y'].iloc[0])
+        if isinstance(self._ball, AnnotationBbox):
+            self._ball.xy = self._ball.xybox = ball_xy
+        else:
+            self._ball.set_offsets([ball_xy])
+
+    def render(self, play: Play, frameId: int, highlight_player_id: int = None, club_colors: dict = None, size: int = 30):
+        """
+        Draws one frame of `play` on the template.
+
+        Returns:
+            tuple: The template's figure and field axes.
+        """
+        final_highlight_id = self.set_play(play, highlight_player_id)
+
+        with profiling.phase('relay.players'):
+            arrays = play._get_frame_arrays(club_colors)
+            frame_idx, rows = play._get_frame_slice(arrays, frameId)
+            if self._player_scatter is None:
+                self._player_scatter = self.ax_field.scatter([], [], clip_on=False)
+            self._player_scatter.set_offsets(arrays['xy'][rows])
+            self._player_scatter.set_color(arrays['colors'][rows])
+            self._player_scatter.set_sizes([size])
+
+            highlight_xy = np.empty((0, 2))
+            if final_highlight_id and frame_idx is not None:
+                highlight_row = play._get_highlight_rows(arrays, final_highlight_id)[frame_idx]
+                if highlight_row >= 0:
+                    highlight_xy = arrays['xy'][highlight_row:highlight_row + 1]
+            if self._highlight_marker is None:
+                self._highlight_marker = self.ax_field.scatter([], [], s=100, facecolors='none', edgecolors='yellow', lw=1.5, clip_on=False)
+            self._highlight_marker.set_offsets(highlight_xy)
+
+            self._set_ball(play)
+
+        return self.fig, self.ax_field
+
+    def close(self):
+        """Closes the template's figure."""
+        plt.close(self.fig)
@@ -9,6 +9,7 @@ setup(
     version='1.3.2',
     packages=find_packages(where="nfl_tracks"),
     package_dir={'': 'nfl_tracks'},
+    package_data={'nfl': ['ball.png']},
     classifiers=[
         "Programming Language :: Python :: 3",
         "Development Status :: 3 - Alpha",
@@ -28,6 +29,10 @@ setup(
     ],
     extras_require={
         "dev": ["pytest"],
+        "fast": ["pyarrow"],
+    },
+    entry_points={
+        "console_scripts": ["nfl-tracks-pipeline=nfl.pipeline:main"],
     },
     url='https://github.com/shammeer-s/nfl-tracks',
     author='Mohammed Shammeer',
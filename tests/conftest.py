@@ -0,0 +1,22 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'nfl_tracks'))
+
+from nfl.config import NFLTracksConfig
+from nfl.synthetic import generate_tracking_data
+
+@pytest.fixture
+def config():
+    return NFLTracksConfig()
+
+@pytest.fixture
+def tracking_data(config):
+    return generate_tracking_data(n_games=2, n_plays=3, n_frames=20, seed=7, config=config)
+
+@pytest.fixture
+def play_data(tracking_data, config):
+    first = tracking_data[[config.game_col, config.play_col]].iloc[0]
+    return tracking_data[(tracking_data[config.game_col] == first.iloc[0]) & (tracking_data[config.play_col] == first.iloc[1])].reset_index(drop=True)
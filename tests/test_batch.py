@@ -0,0 +1,14 @@
+from nfl import batch, visuals
+
+def test_template_failure_fails_the_job_only(tracking_data, config, tmp_path, monkeypatch):
+    def broken_template(**kwargs):
+        raise RuntimeError("no template")
+    monkeypatch.setattr(visuals, 'RelayTemplate', broken_template)
+
+    game_id, play_id = tracking_data[[config.game_col, config.play_col]].iloc[0]
+    jobs = [(game_id, play_id, 1), (game_id, play_id, 2)]
+    result = batch.render_plays(tracking_data, jobs, str(tmp_path), config=config, processes=1, allow_network=False, relay=True)
+
+    assert len(result) == 2
+    assert result['path'].isna().all()
+    assert (result['error'] == "RuntimeError: no template").all()
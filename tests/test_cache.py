@@ -0,0 +1,19 @@
+import os
+
+import pandas as pd
+
+from nfl import metrics
+from nfl.cache import MetricsCache
+
+def test_corrupt_entry_is_a_miss_and_rewritten(tracking_data, config, tmp_path):
+    cache = MetricsCache(str(tmp_path))
+    expected = cache.call(metrics.get_play_speed_stats_batch, tracking_data, config)
+    (entry,) = os.listdir(tmp_path)
+    with open(tmp_path / entry, 'r+b') as f:
+        f.truncate(16)
+
+    result = cache.call(metrics.get_play_speed_stats_batch, tracking_data, config)
+    pd.testing.assert_frame_equal(result, expected)
+    assert cache.stats['misses'] == 2
+    assert cache.call(metrics.get_play_speed_stats_batch, tracking_data, config).equals(expected)
+    assert cache.stats['hits'] == 1
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.optimize import linear_sum_assignment
+from scipy.spatial.distance import cdist
+
+from nfl import coverage, metrics
+
+def reference_assignment(frame, config):
+    offense = frame[(frame[config.player_side_col] == 'Offense') & frame[['x', 'y']].notna().all(axis=1)]
+    defense = frame[(frame[config.player_side_col] == 'Defense') & frame[['x', 'y']].notna().all(axis=1)]
+    if offense.empty or defense.empty:
+        return {}
+    rows, cols = linear_sum_assignment(cdist(offense[['x', 'y']], defense[['x', 'y']]))
+    return dict(zip(offense[config.player_id_col].to_numpy()[rows], defense[config.player_id_col].to_numpy()[cols]))
+
+@pytest.fixture
+def data_with_nan(play_data, config):
+    data = play_data.copy()
+    frames, sides, ids = data[config.frame_col], data[config.player_side_col], data[config.player_id_col]
+    data.loc[(frames == 2) & (ids == 40008), 'x'] = np.nan
+    data.loc[(frames == 3) & (ids == 40001), 'y'] = np.nan
+    data.loc[(frames == 4) & (sides == 'Defense'), ['x', 'y']] = np.nan
+    return data
+
+def test_coverage_matchups_skips_missing_positions(data_with_nan, config):
+    result = coverage.coverage_matchups(data_with_nan, config, chunk_size=5)
+
+    for frame_id, frame in data_with_nan.groupby(config.frame_col):
+        expected = reference_assignment(frame, config)
+        in_frame = result[result[config.frame_col] == frame_id].set_index(config.player_id_col)
+        assigned = in_frame['assigned_defender_id'].dropna().astype(int).to_dict()
+        assert assigned == expected
+
+    nan_receiver = result[(result[config.frame_col] == 3) & (result[config.player_id_col] == 40001)].iloc[0]
+    assert pd.isna(nan_receiver['assigned_defender_id']) and np.isnan(nan_receiver['separation'])
+    assert result.loc[result[config.frame_col] == 4, 'assigned_defender_id'].isna().all()
+    assert not result.loc[result[config.frame_col] == 2, 'assigned_defender_id'].isin([40008]).any()
+
+def test_coverage_separation_matches_separation_engine(data_with_nan, config):
+    keys = [config.game_col, config.play_col, config.frame_col, config.player_id_col]
+    result = coverage.coverage_matchups(data_with_nan, config).dropna(subset=['separation'])
+    expected = metrics.calculate_separation_batch(data_with_nan, config)
+    merged = result.merge(expected, on=keys, suffixes=('', '_expected'))
+    assert len(merged) == len(result) == len(expected)
+    np.testing.assert_allclose(merged['separation'], merged['separation_expected'])
+    assert (merged['nearest_defender_id'] == merged['nearest_defender_id_expected']).all()
@@ -0,0 +1,44 @@
+import json
+import re
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.animation as animation
+import matplotlib.pyplot as plt
+import numpy as np
+from PIL import Image, ImageSequence
+
+from nfl import visuals
+from nfl.encoding import StreamingGifWriter, build_html_player
+
+def gif_frames(path):
+    with Image.open(path) as image:
+        return [np.asarray(frame.convert('RGB')).astype(int) for frame in ImageSequence.Iterator(image)]
+
+def save_animation(play_data, config, path, writer):
+    play = visuals.Play(play_data, play_data[config.game_col].iloc[0], play_data[config.play_col].iloc[0], config=config)
+    play.animate(save=True, filename=str(path), kaggle=False, writer=writer)
+    plt.close('all')
+
+def test_streaming_gif_matches_pillow_writer(play_data, config, tmp_path):
+    save_animation(play_data, config, tmp_path / 'stream.gif', StreamingGifWriter(fps=15))
+    save_animation(play_data, config, tmp_path / 'pillow.gif', animation.PillowWriter(fps=15))
+
+    streamed, reference = gif_frames(tmp_path / 'stream.gif'), gif_frames(tmp_path / 'pillow.gif')
+    assert len(streamed) == len(reference) == play_data[config.frame_col].nunique()
+    for frame, expected in zip(streamed, reference):
+        assert frame.shape == expected.shape
+        assert (np.abs(frame - expected).sum(axis=-1) > 60).mean() < 0.001
+
+def test_html_player_holds_every_frame():
+    fig, ax = plt.subplots()
+    ax.set_xlim(0, 10)
+    ax.set_ylim(0, 10)
+    frames_xy = [np.array([[1.0, 2.0], [3.0, 4.0]]), np.array([[1.5, 2.5]])]
+    html = build_html_player(fig, ax, frames_xy, [np.array([0, 1]), np.array([1])], ['#ff0000', '#0000ff'], [1, -1])
+    plt.close(fig)
+
+    data = json.loads(re.search(r'var data = (\{.*\});', html).group(1))
+    assert data['frames'] == [[1.0, 2.0, 0, 3.0, 4.0, 1], [1.5, 2.5, 1]]
+    assert data['highlight'] == [1, -1]
+    assert 'max="1"' in html
@@ -0,0 +1,28 @@
+import os
+
+import pandas as pd
+
+from nfl import loader
+
+def test_load_tracking_parses_compact_dtypes(tracking_data, config, tmp_path):
+    path = tmp_path / 'input_2023_w01.csv'
+    tracking_data.to_csv(path, index=False)
+
+    data = loader.load_tracking(str(path), config, use_cache=False)
+    expected = loader.downcast_tracking_data(pd.read_csv(path, usecols=list(data.columns)), config)
+
+    assert data[['x', 'y', 's']].dtypes.eq('float32').all()
+    assert isinstance(data[config.player_side_col].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(data, expected)
+
+def test_corrupt_cache_file_is_parsed_again(tracking_data, config, tmp_path):
+    path = tmp_path / 'input_2023_w01.csv'
+    tracking_data.to_csv(path, index=False)
+    cache_dir = tmp_path / 'cache'
+    expected = loader.load_tracking(str(path), config, cache_dir=str(cache_dir))
+    (entry,) = os.listdir(cache_dir)
+    with open(cache_dir / entry, 'r+b') as f:
+        f.truncate(16)
+
+    pd.testing.assert_frame_equal(loader.load_tracking(str(path), config, cache_dir=str(cache_dir)), expected)
+    pd.testing.assert_frame_equal(loader.load_tracking(str(path), config, cache_dir=str(cache_dir)), expected)
@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.spatial.distance import cdist
+
+from nfl import metrics
+from nfl.track import PlayTrack
+
+# Per-frame and per-player loop implementations the batch metrics replaced, kept as the reference they must match.
+
+def reference_separation(play_data, config):
+    separation_data = []
+    for frame_id in sorted(play_data[config.frame_col].unique()):
+        frame_df = play_data[play_data[config.frame_col] == frame_id]
+        offense_df = frame_df[frame_df[config.player_side_col] == 'Offense']
+        defense_df = frame_df[frame_df[config.player_side_col] == 'Defense']
+        if offense_df.empty or defense_df.empty:
+            continue
+        min_distances = np.min(cdist(offense_df[['x', 'y']], defense_df[['x', 'y']]), axis=1)
+        for i, player_id in enumerate(offense_df[config.player_id_col]):
+            separation_data.append({
+                config.game_col: play_data[config.game_col].iloc[0],
+                config.play_col: play_data[config.play_col].iloc[0],
+                config.frame_col: frame_id,
+                config.player_id_col: player_id,
+                'separation': min_distances[i],
+            })
+    return pd.DataFrame(separation_data)
+
+def reference_speed_stats(play_data, config):
+    speed_stats = play_data.groupby(config.player_id_col)['s'].agg(['max', 'mean']).reset_index()
+    speed_stats = speed_stats.rename(columns={'max': 'max_speed', 'mean': 'avg_speed'})
+    player_info = play_data[[config.player_id_col, 'player_name']].drop_duplicates()
+    return pd.merge(speed_stats, player_info, on=config.player_id_col)
+
+def reference_distance(play_data, config):
+    distance_data = []
+    for player_id in play_data[config.player_id_col].unique():
+        player_df = play_data[play_data[config.player_id_col] == player_id].sort_values(by=config.frame_col)
+        diffs = np.diff(player_df[['x', 'y']].values, axis=0)
+        distance_data.append({config.player_id_col: player_id, 'total_distance': np.sum(np.sqrt(np.sum(diffs ** 2, axis=1)))})
+    distance_df = pd.DataFrame(distance_data)
+    player_info = play_data[[config.player_id_col, 'player_name']].drop_duplicates()
+    return pd.merge(distance_df, player_info, on=config.player_id_col)
+
+def sorted_frame(df, columns):
+    return df.sort_values(columns, ignore_index=True)
+
+def assert_same(actual, expected, keys):
+    assert list(actual.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(sorted_frame(actual, keys), sorted_frame(expected, keys), check_dtype=False)
+
+def plays(tracking_data, config):
+    return [group for _, group in tracking_data.groupby([config.game_col, config.play_col], sort=True)]
+
+@pytest.fixture(params=['ordered', 'shuffled'])
+def variant(request, tracking_data):
+    if request.param == 'shuffled':
+        return tracking_data.sample(frac=1, random_state=3).reset_index(drop=True)
+    return tracking_data
+
+def test_separation_matches_reference(variant, config):
+    keys = [config.game_col, config.play_col, config.frame_col, config.player_id_col]
+    for play_data in plays(variant, config):
+        assert_same(metrics.calculate_separation(play_data, config), reference_separation(play_data, config), keys)
+
+def test_separation_skips_frames_with_a_missing_side(play_data, config):
+    frames = play_data[config.frame_col]
+    no_defense = (play_data[config.player_side_col] == 'Defense') & frames.isin([3, 4])
+    no_offense = (play_data[config.player_side_col] == 'Offense') & frames.isin([9])
+    play_data = play_data[~(no_defense | no_offense)]
+
+    result = metrics.calculate_separation(play_data, config)
+    assert not result[config.frame_col].isin([3, 4, 9]).any()
+    assert_same(result, reference_separation(play_data, config), [config.frame_col, config.player_id_col])
+
+def test_separation_batch_matches_per_play(variant, config):
+    keys = [config.game_col, config.play_col, config.frame_col, config.player_id_col]
+    batch = metrics.calculate_separation_batch(variant, config, chunk_size=7)
+    expected = pd.concat([reference_separation(play_data, config) for play_data in plays(variant, config)], ignore_index=True)
+    assert_same(batch.drop(columns='nearest_defender_id'), expected, keys)
+
+def test_speed_stats_match_reference(variant, config):
+    for play_data in plays(variant, config):
+        assert_same(metrics.get_play_speed_stats(play_data, config), reference_speed_stats(play_data, config), [config.player_id_col])
+
+def test_distance_matches_reference(variant, config):
+    for play_data in plays(variant, config):
+        assert_same(metrics.get_total_distance_traveled(play_data, config), reference_distance(play_data, config), [config.player_id_col])
+
+def test_batch_stats_match_single_play_wrappers(variant, config):
+    speed = metrics.get_play_speed_stats_batch(variant, config)
+    distance = metrics.get_total_distance_traveled_batch(variant, config)
+    for play_data in plays(variant, config):
+        game_id, play_id = play_data[config.game_col].iloc[0], play_data[config.play_col].iloc[0]
+        in_play = lambda df: df[(df[config.game_col] == game_id) & (df[config.play_col] == play_id)].drop(columns=[config.game_col, config.play_col])
+        assert_same(in_play(speed), metrics.get_play_speed_stats(play_data, config), [config.player_id_col])
+        assert_same(in_play(distance), metrics.get_total_distance_traveled(play_data, config), [config.player_id_col])
+
+def test_play_track_metrics_match_frame_path(variant, config):
+    for play_data in plays(variant, config):
+        track = PlayTrack(play_data, config)
+        frame = track.to_frame(config)
+        assert_same(metrics.calculate_separation_batch(track, config), metrics.calculate_separation_batch(frame, config),
+                    [config.frame_col, config.player_id_col])
+        assert_same(metrics.get_play_speed_stats_batch(track, config), metrics.get_play_speed_stats_batch(frame, config), [config.player_id_col])
+        assert_same(metrics.get_total_distance_traveled_batch(track, config), metrics.get_total_distance_traveled_batch(frame, config),
+                    [config.player_id_col])
+
+def test_play_track_keeps_player_and_play_columns(play_data, config):
+    frame = PlayTrack(play_data, config).to_frame(config)
+    for col in PlayTrack.PLAYER_COLUMNS + PlayTrack.PLAY_COLUMNS:
+        if col in play_data.columns:
+            expected = play_data.set_index([config.frame_col, config.player_id_col])[col]
+            actual = frame.set_index([config.frame_col, config.player_id_col])[col].reindex(expected.index)
+            assert (actual.astype(str) == expected.astype(str)).all(), col
@@ -0,0 +1,48 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from nfl import metrics, pipeline
+from nfl.loader import load_tracking
+from nfl.synthetic import generate_tracking_data
+
+def write_weeks(directory, config, n_weeks=2):
+    for week in range(1, n_weeks + 1):
+        data = generate_tracking_data(n_games=1, n_plays=2, n_frames=10, seed=week, config=config)
+        data.to_csv(directory / f"input_2023_w0{week}.csv", index=False)
+
+def read_output(path):
+    return pd.read_feather(path) if path.endswith('.feather') else pd.read_csv(path)
+
+def test_pipeline_writes_batch_metrics_per_shard(tmp_path, config):
+    write_weeks(tmp_path, config)
+    report = pipeline.run_pipeline(str(tmp_path / 'input_*.csv'), str(tmp_path / 'out'), processes=1, use_cache=False)
+    assert report['status'].tolist() == ['done', 'done']
+
+    expected = metrics.calculate_separation_batch(load_tracking(str(tmp_path / 'input_2023_w02.csv'), config, use_cache=False), config)
+    result = read_output(pipeline._output_path(str(tmp_path / 'out'), 'separation', 'input_2023_w02'))
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+def test_pipeline_resumes_and_redoes_changed_shards(tmp_path, config):
+    write_weeks(tmp_path, config)
+    pattern, output_dir = str(tmp_path / 'input_*.csv'), str(tmp_path / 'out')
+    pipeline.run_pipeline(pattern, output_dir, processes=1, use_cache=False)
+
+    report = pipeline.run_pipeline(pattern, output_dir, processes=1, use_cache=False)
+    assert report['status'].tolist() == ['skipped', 'skipped']
+
+    changed = tmp_path / 'input_2023_w01.csv'
+    data = pd.read_csv(changed)
+    data.iloc[:len(data) // 2].to_csv(changed, index=False)
+    report = pipeline.run_pipeline(pattern, output_dir, processes=1, use_cache=False)
+    assert report['status'].tolist() == ['done', 'skipped']
+    assert report['rows'].iloc[0] == len(data) // 2
+
+def test_pipeline_coverage_with_missing_positions(tmp_path, config):
+    data = generate_tracking_data(n_games=1, n_plays=2, n_frames=10, seed=1, config=config)
+    data.loc[data.index[::17], 'x'] = np.nan
+    data.to_csv(tmp_path / 'input_2023_w01.csv', index=False)
+    report = pipeline.run_pipeline(str(tmp_path / '*.csv'), str(tmp_path / 'out'), metrics=['coverage'], processes=1, use_cache=False)
+    assert report['status'].tolist() == ['done']
+    assert os.path.exists(pipeline._marker_path(str(tmp_path / 'out'), 'input_2023_w01'))
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+from scipy.spatial.distance import cdist
+
+from nfl.spatial import SpatialIndex
+
+def brute_force_neighbors(tracking_data, config, k, teammates):
+    rows = []
+    for keys, frame in tracking_data.groupby([config.game_col, config.play_col, config.frame_col]):
+        xy = frame[['x', 'y']].to_numpy(dtype=float)
+        ids, sides = frame[config.player_id_col].to_numpy(), frame[config.player_side_col].astype(str).to_numpy()
+        distances = cdist(xy, xy)
+        for i in range(len(frame)):
+            candidates = np.flatnonzero((sides == sides[i]) == teammates)
+            candidates = candidates[candidates != i]
+            nearest = candidates[np.argsort(distances[i, candidates], kind='stable')][:k]
+            for rank, j in enumerate(nearest, start=1):
+                rows.append((*keys, ids[i], rank, ids[j], distances[i, j]))
+    columns = [config.game_col, config.play_col, config.frame_col, config.player_id_col, 'rank', 'neighbor_id', 'distance']
+    return pd.DataFrame(rows, columns=columns)
+
+def compare(result, expected, config):
+    keys = [config.game_col, config.play_col, config.frame_col, config.player_id_col, 'rank']
+    result = result[expected.columns].sort_values(keys, ignore_index=True)
+    expected = expected.sort_values(keys, ignore_index=True)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+def test_nearest_opponents_match_brute_force(tracking_data, config):
+    index = SpatialIndex(tracking_data, config)
+    compare(index.nearest_opponents(k=2), brute_force_neighbors(tracking_data, config, 2, teammates=False), config)
+
+def test_nearest_teammates_match_brute_force(tracking_data, config):
+    index = SpatialIndex(tracking_data, config)
+    compare(index.nearest_teammates(k=3), brute_force_neighbors(tracking_data, config, 3, teammates=True), config)
+
+def test_within_radius_matches_brute_force(tracking_data, config):
+    result = SpatialIndex(tracking_data, config).within_radius(5.0)
+    expected = 0
+    for _, frame in tracking_data.groupby([config.game_col, config.play_col, config.frame_col]):
+        distances = cdist(frame[['x', 'y']], frame[['x', 'y']])
+        expected += int(((distances <= 5.0) & ~np.eye(len(frame), dtype=bool)).sum())
+    assert len(result) == expected
+    assert (result['distance'] <= 5.0).all()
+    assert (result[config.player_id_col] != result['neighbor_id']).all()
+
+def test_queries_without_opponents_or_neighbors_are_empty(tracking_data, config):
+    offense = tracking_data[tracking_data[config.player_side_col] == 'Offense']
+    index = SpatialIndex(offense, config)
+    assert index.nearest_opponents().empty
+    assert index.nearest_opponents(k=0).empty
+    assert index.nearest_teammates(k=0).empty
+    assert not index.nearest_teammates().empty
+    assert list(index.nearest_opponents().columns) == list(index.nearest_teammates().columns)
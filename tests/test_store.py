@@ -0,0 +1,10 @@
+from nfl.store import TrackingStore
+
+def test_game_plays_lists_each_games_plays(tracking_data, config):
+    store = TrackingStore(tracking_data, config=config)
+    for game_id, game in tracking_data.groupby(config.game_col):
+        expected = sorted(game[config.play_col].unique().tolist())
+        assert store.game_plays(game_id) == expected
+        store.game_plays(game_id).clear()
+        assert store.game_plays(game_id) == expected
+    assert store.game_plays(-1) == []
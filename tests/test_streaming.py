@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+from nfl import metrics
+from nfl.streaming import MetricsAccumulator
+from nfl.synthetic import generate_tracking_data
+
+def frames_in_feed_order(tracking_data, config):
+    keys = [config.frame_col, config.game_col, config.play_col]
+    return [frame for _, frame in tracking_data.sort_values(keys, kind='stable').groupby(keys, sort=False)]
+
+def test_accumulator_matches_batch_metrics(tracking_data, config):
+    tracking_data = tracking_data.drop(index=tracking_data.index[(tracking_data[config.frame_col] == 5) & (tracking_data[config.player_id_col] == 40002)])
+    acc = MetricsAccumulator(config, keep_separation=True)
+    for separation in acc.consume(frames_in_feed_order(tracking_data, config)):
+        assert not separation['separation'].isna().any()
+
+    pd.testing.assert_frame_equal(acc.distance(), metrics.get_total_distance_traveled_batch(tracking_data, config), check_dtype=False)
+    speed = acc.speed_stats()
+    pd.testing.assert_frame_equal(speed, metrics.get_play_speed_stats_batch(tracking_data, config)[speed.columns], check_dtype=False)
+
+    keys = [config.game_col, config.play_col, config.frame_col, config.player_id_col]
+    expected = metrics.calculate_separation(tracking_data, config).sort_values(keys, ignore_index=True)
+    pd.testing.assert_frame_equal(acc.separation().sort_values(keys, ignore_index=True), expected, check_dtype=False)
+
+def test_accumulator_drops_separation_of_missing_positions(tracking_data, config):
+    tracking_data = tracking_data.copy()
+    offense = tracking_data[config.player_side_col] == 'Offense'
+    defense = tracking_data[config.player_side_col] == 'Defense'
+    tracking_data.loc[offense & (tracking_data[config.frame_col] == 3), 'x'] = np.nan
+    tracking_data.loc[defense & (tracking_data[config.frame_col] == 4) & (tracking_data[config.player_id_col] == 40010), 'y'] = np.nan
+
+    acc = MetricsAccumulator(config, keep_separation=True)
+    list(acc.consume(frames_in_feed_order(tracking_data, config)))
+
+    keys = [config.game_col, config.play_col, config.frame_col, config.player_id_col]
+    expected = metrics.calculate_separation(tracking_data, config).sort_values(keys, ignore_index=True)
+    pd.testing.assert_frame_equal(acc.separation().sort_values(keys, ignore_index=True), expected, check_dtype=False)
+
+def test_end_play_returns_final_rows_and_releases_state(config):
+    acc = MetricsAccumulator(config)
+    for seed in range(10):
+        tracking_data = generate_tracking_data(n_games=1, n_plays=2, n_frames=10, seed=seed, config=config)
+        list(acc.consume(frames_in_feed_order(tracking_data, config)))
+
+        for (game_id, play_id), play_data in tracking_data.groupby([config.game_col, config.play_col]):
+            final = acc.end_play(game_id, play_id)
+            expected = metrics.get_total_distance_traveled_batch(play_data, config).merge(
+                metrics.get_play_speed_stats_batch(play_data, config).drop(columns='player_name'))
+            pd.testing.assert_frame_equal(final, expected[final.columns], check_dtype=False)
+
+        assert acc.distance().empty
+    assert len(acc._seen) <= 32
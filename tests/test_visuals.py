@@ -0,0 +1,38 @@
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from PIL import Image
+
+from nfl import visuals
+
+@pytest.fixture
+def play(play_data, config):
+    return visuals.Play(play_data, play_data[config.game_col].iloc[0], play_data[config.play_col].iloc[0], config=config)
+
+def saved_pixels(play, path, **kwargs):
+    play.plot_snap(2, save=True, filename=str(path), **kwargs)
+    plt.close('all')
+    return np.asarray(Image.open(path).convert('RGB')).astype(int)
+
+def test_raster_field_is_rendered_at_save_dpi(play, tmp_path):
+    vector = saved_pixels(play, tmp_path / 'vector.png')
+    raster = saved_pixels(play, tmp_path / 'raster.png', raster=True)
+    assert raster.shape == vector.shape
+    assert (np.abs(raster - vector).sum(axis=-1) > 60).mean() < 0.005
+
+def test_animate_saves_the_file_with_html_player(play, tmp_path):
+    path = tmp_path / 'play.gif'
+    html = play.animate(save=True, filename=str(path), html_player=True)
+    plt.close('all')
+    assert path.exists() and path.stat().st_size > 0
+    assert '<canvas' in html.data
+
+def test_non_string_club_colors(play, tmp_path):
+    colors = {'Offense': [1, 0, 0], 'Defense': (0, 0, 1, 0.5)}
+    play.plot_snap(2, save=True, filename=str(tmp_path / 'snap.png'), club_colors=colors)
+    play.animate(save=True, filename=str(tmp_path / 'play.gif'), kaggle=False, club_colors=colors)
+    plt.close('all')
+    assert (tmp_path / 'snap.png').exists() and (tmp_path / 'play.gif').exists()
+    assert play._get_frame_arrays({'Offense': 'red'}) is play._get_frame_arrays({'Offense': (1, 0, 0)})